@@ -5,6 +5,7 @@ from .drawable import Drawable
 from .focusable import Focusable
 from .clickable import Clickable
 from .image import Image
+from .scrolling import ScrollingImage
 from .text import Text
 from .shape import RectangleShape, CircleShape, PolygonShape
 from .button import Button, ImageButton
@@ -13,8 +14,8 @@ from .progress import ProgressBar
 from .scale import Scale
 from .checkbox import CheckBox
 from .list import DrawableList, DrawableListHorizontal, DrawableListVertical, ButtonListHorizontal, ButtonListVertical
-from .sprite import Sprite
-from .clock import Clock
+from .sprite import Sprite, AnimationClip
+from .clock import Clock, TimeService, GAME_TIME, REAL_TIME
 from .count_down import CountDown
 from .colors import *
 from .joystick import Joystick
@@ -23,6 +24,15 @@ from .loading import Loading
 from .dialog import Dialog
 from .path import set_constant_file, set_constant_directory
 from .resources import RESOURCES
+from .dirty_rect import DIRTY_RECTS
+from .transform_cache import TRANSFORM_CACHE
 from .thread import threaded_function
+from .pool import ObjectPool
+from .scene_cache import SCENE_CACHE
+from .preloader import PRELOADER
+from .frame_limiter import FrameLimiter, LatenessHistogram
+from .quality import QUALITY, QualityGovernor
+from .collision import CollisionData, get_collision_data, collide
 from .multiplayer import ServerSocket, ClientSocket
 from .vector import Vector2
+from .camera import Camera
@@ -0,0 +1,49 @@
+# -*- coding: Utf-8 -*
+
+from typing import Tuple
+import pygame
+from .list import DrawableList
+
+class Camera:
+
+    __slots__ = ("__world", "__x", "__y")
+
+    def __init__(self, world: DrawableList, x=0, y=0):
+        if not isinstance(world, DrawableList) or not world.transform:
+            raise TypeError("The camera world must be a transform DrawableList")
+        self.__world = world
+        self.__x = self.__y = 0
+        self.move(x, y)
+
+    @property
+    def world(self) -> DrawableList:
+        return self.__world
+
+    @property
+    def x(self) -> float:
+        return self.__x
+
+    @property
+    def y(self) -> float:
+        return self.__y
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        return (self.__x, self.__y)
+
+    def move(self, x: float, y: float) -> None:
+        self.__x = x
+        self.__y = y
+        self.__world.translation = (-x, -y)
+
+    def move_ip(self, x: float, y: float) -> None:
+        self.move(self.__x + x, self.__y + y)
+
+    def to_screen(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        return (round(point[0] - self.__x), round(point[1] - self.__y))
+
+    def to_world(self, point: Tuple[float, float]) -> Tuple[float, float]:
+        return (point[0] + self.__x, point[1] + self.__y)
+
+    def viewport(self, size: Tuple[int, int]) -> pygame.Rect:
+        return pygame.Rect((round(self.__x), round(self.__y)), size)
@@ -32,6 +32,7 @@ class CheckBox(Clickable, RectangleShape):
         elif value not in [self.__on_value, self.__off_value]:
             return
         self.__value = value
+        self.mark_dirty()
         if callable(self.__on_changed_value):
             self.__on_changed_value(self.__value)
 
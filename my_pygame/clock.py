@@ -1,18 +1,81 @@
 # -*- coding: Utf-8 -*
 
-import pygame.time
+import time
 
-class Clock(object):
+class TimeService(object):
 
-    __slots__ = ("__time", "__clock")
+    __slots__ = ("__source", "__last", "__time", "__scale", "__paused", "__virtual_time")
 
     def __init__(self):
+        self.__source = time.perf_counter_ns
+        self.__last = self.__source()
+        self.__time = 0
+        self.__scale = 1
+        self.__paused = False
+        self.__virtual_time = 0
+
+    def now(self) -> float:
+        current = self.__source()
+        if not self.__paused:
+            self.__time += (current - self.__last) * self.__scale
+        self.__last = current
+        return self.__time / 1e6
+
+    def pause(self) -> None:
+        self.now()
+        self.__paused = True
+
+    def resume(self) -> None:
+        self.now()
+        self.__paused = False
+
+    def is_paused(self) -> bool:
+        return self.__paused
+
+    @property
+    def scale(self) -> float:
+        return self.__scale
+
+    @scale.setter
+    def scale(self, value: float) -> None:
+        self.now()
+        self.__scale = max(float(value), 0)
+
+    def use_virtual_clock(self) -> None:
+        self.now()
+        self.__virtual_time = 0
+        self.__source = lambda: self.__virtual_time
+        self.__last = self.__virtual_time
+
+    def use_real_clock(self) -> None:
+        self.now()
+        self.__source = time.perf_counter_ns
+        self.__last = self.__source()
+
+    def is_virtual(self) -> bool:
+        return self.__source is not time.perf_counter_ns
+
+    def advance(self, milliseconds: float) -> None:
+        if not self.is_virtual():
+            raise RuntimeError("Only a virtual clock can be advanced manually")
+        self.__virtual_time += round(milliseconds * 1e6)
+
+GAME_TIME = TimeService()
+REAL_TIME = TimeService()
+
+class Clock(object):
+
+    __slots__ = ("__time", "__last", "__time_service")
+
+    def __init__(self, time_service=GAME_TIME):
+        self.__time_service = time_service
         self.__time = 0
-        self.__clock = pygame.time.Clock()
+        self.__last = time_service.now()
 
-    def get_elapsed_time(self) -> int:
-        self.__clock.tick()
-        self.__time += self.__clock.get_rawtime()
+    def get_elapsed_time(self) -> float:
+        now = self.__time_service.now()
+        self.__time += now - self.__last
+        self.__last = now
         return self.__time
 
     def elapsed_time(self, milliseconds: int, restart=True) -> bool:
@@ -23,8 +86,8 @@ class Clock(object):
         return False
 
     def restart(self) -> None:
-        self.__clock.tick()
+        self.__last = self.__time_service.now()
         self.__time = 0
 
     def tick(self):
-        self.__clock.tick()
\ No newline at end of file
+        self.__last = self.__time_service.now()
@@ -0,0 +1,122 @@
+# -*- coding: Utf-8 -*
+
+from typing import List, Tuple, Sequence, Union
+import pygame
+from .surface import get_surface_mask, COLLISION_DATA_CACHE
+
+Point = Tuple[int, int]
+
+def convex_hull(points: Sequence[Point]) -> Tuple[Point, ...]:
+    points = sorted(set(points))
+    if len(points) <= 2:
+        return tuple(points)
+
+    def cross(o: Point, a: Point, b: Point) -> int:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower = list()
+    for point in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = list()
+    for point in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return tuple(lower[:-1] + upper[:-1])
+
+class CollisionData:
+
+    __slots__ = ("__mask", "__bbox", "__hull", "__axes")
+
+    def __init__(self, surface: pygame.Surface):
+        self.__mask = mask = get_surface_mask(surface)
+        rects = mask.get_bounding_rects()
+        self.__bbox = rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+        self.__hull = self.__axes = None
+
+    def __compute_hull(self) -> None:
+        mask = self.__mask
+        points = list()
+        row = pygame.mask.Mask((mask.get_size()[0], 1))
+        for y in range(self.__bbox.top, self.__bbox.bottom):
+            row.clear()
+            row.draw(mask, (0, -y))
+            row_rects = row.get_bounding_rects()
+            if row_rects:
+                left = min(rect.left for rect in row_rects)
+                right = max(rect.right for rect in row_rects)
+                points.extend(((left, y), (right, y), (left, y + 1), (right, y + 1)))
+        self.__hull = convex_hull(points)
+        self.__axes = self.__compute_axes(self.__hull)
+
+    @staticmethod
+    def __compute_axes(hull: Sequence[Point]) -> Tuple[Point, ...]:
+        axes = list()
+        for i, (x1, y1) in enumerate(hull):
+            x2, y2 = hull[(i + 1) % len(hull)]
+            axes.append((y1 - y2, x2 - x1))
+        return tuple(axes)
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        return self.__mask
+
+    @property
+    def bbox(self) -> pygame.Rect:
+        return self.__bbox
+
+    @property
+    def hull(self) -> Tuple[Point, ...]:
+        if self.__hull is None:
+            self.__compute_hull()
+        return self.__hull
+
+    @property
+    def axes(self) -> Tuple[Point, ...]:
+        if self.__axes is None:
+            self.__compute_hull()
+        return self.__axes
+
+def get_collision_data(surface: pygame.Surface) -> CollisionData:
+    data = COLLISION_DATA_CACHE.get(surface)
+    if data is None:
+        data = COLLISION_DATA_CACHE[surface] = CollisionData(surface)
+    return data
+
+def _project(hull: Sequence[Point], axis: Point, x: int, y: int) -> Tuple[int, int]:
+    offset = x * axis[0] + y * axis[1]
+    values = [px * axis[0] + py * axis[1] for px, py in hull]
+    return (min(values) + offset, max(values) + offset)
+
+def collide_bbox(data_1: CollisionData, rect_1: pygame.Rect, data_2: CollisionData, rect_2: pygame.Rect) -> bool:
+    return data_1.bbox.move(rect_1.topleft).colliderect(data_2.bbox.move(rect_2.topleft))
+
+def collide_hull(data_1: CollisionData, rect_1: pygame.Rect, data_2: CollisionData, rect_2: pygame.Rect) -> bool:
+    if not data_1.hull or not data_2.hull:
+        return False
+    for axis in data_1.axes + data_2.axes:
+        min_1, max_1 = _project(data_1.hull, axis, rect_1.x, rect_1.y)
+        min_2, max_2 = _project(data_2.hull, axis, rect_2.x, rect_2.y)
+        if max_1 <= min_2 or max_2 <= min_1:
+            return False
+    return True
+
+def collide_mask(data_1: CollisionData, rect_1: pygame.Rect, data_2: CollisionData, rect_2: pygame.Rect) -> Union[Point, None]:
+    return data_1.mask.overlap(data_2.mask, (rect_2.x - rect_1.x, rect_2.y - rect_1.y))
+
+def collide(obj_1, obj_2, hull=False) -> Union[Point, None]:
+    """Return the first overlapping point between obj_1 and obj_2 masks, or None.
+
+    The bounding boxes are compared first, then the masks. The convex hull test is opt-in (hull=True):
+    on the game sprites it costs far more than the mask overlap it would skip
+    (tests/bench_collisions.py), so the game never enables it.
+    """
+    data_1 = get_collision_data(obj_1.image)
+    data_2 = get_collision_data(obj_2.image)
+    if not collide_bbox(data_1, obj_1.rect, data_2, obj_2.rect):
+        return None
+    if hull and not collide_hull(data_1, obj_1.rect, data_2, obj_2.rect):
+        return None
+    return collide_mask(data_1, obj_1.rect, data_2, obj_2.rect)
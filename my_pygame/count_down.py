@@ -26,6 +26,8 @@ class CountDown(Text):
         self.__time = self.__seconds
         self.__started = True
         self.__callback = at_end if callable(at_end) else None
+        self.__master.remove_window_callback(self.__window_callback)
+        self.__window_callback = self.__master.after(1000, self.__update_count, repeat=True)
         self.__update_count()
 
     def stop(self) -> None:
@@ -40,12 +42,12 @@ class CountDown(Text):
             return
         if self.__time > 0:
             self.message = self.__format.format(seconds=self.__time)
-            self.__window_callback = self.__master.after(1000, self.__update_count)
             self.__time -= 1
         else:
             self.__end()
 
     def __end(self) -> None:
+        self.__master.remove_window_callback(self.__window_callback)
         self.hide()
         if callable(self.__callback):
             self.__callback()
\ No newline at end of file
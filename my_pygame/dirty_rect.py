@@ -0,0 +1,103 @@
+# -*- coding: Utf-8 -*
+
+import weakref
+from typing import List, Dict, Iterable, Optional, Any
+import pygame
+
+def merge_rects(rect_list: List[pygame.Rect]) -> List[pygame.Rect]:
+    merged = list()
+    for rect in rect_list:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index >= 0:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+class DirtyRects:
+
+    __slots__ = ("__rects", "__objects", "__drawn", "__last_drawn", "__full_screen", "__revision", "__changes")
+
+    def __init__(self):
+        self.__rects = list()
+        self.__objects = dict()
+        self.__drawn = dict()
+        self.__last_drawn = dict()
+        self.__full_screen = False
+        self.__revision = 0
+        self.__changes = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self.__rects) + len(self.__objects)
+
+    @property
+    def revision(self) -> int:
+        return self.__revision
+
+    def __touch(self, obj: Any) -> None:
+        self.__revision += 1
+        self.__changes[obj] = self.__revision
+
+    def changed_since(self, objects: Iterable[Any], revision: int) -> bool:
+        if self.__revision == revision:
+            return False
+        changes = self.__changes
+        return any(changes.get(obj, 0) > revision for obj in objects)
+
+    def touch(self, obj: Any) -> None:
+        self.__touch(obj)
+
+    def add(self, rect: pygame.Rect, obj: Optional[Any] = None) -> None:
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self.__rects.append(rect)
+            if obj is not None:
+                self.__touch(obj)
+
+    def track(self, obj: Any, rect: pygame.Rect, image: Optional[pygame.Surface], shown: bool) -> None:
+        self.__touch(obj)
+        if obj not in self.__objects:
+            self.__objects[obj] = (pygame.Rect(rect), image, shown)
+
+    def drawn(self, obj: Any, rect: pygame.Rect) -> None:
+        self.__drawn[obj] = rect
+
+    def drawn_objects(self) -> Dict[Any, pygame.Rect]:
+        return dict(self.__drawn)
+
+    def redrawn(self, drawn: Dict[Any, pygame.Rect]) -> None:
+        self.__drawn.update(drawn)
+
+    def invalidate(self) -> None:
+        self.__full_screen = True
+
+    def flush(self, screen_rect: pygame.Rect, threshold: float) -> List[pygame.Rect]:
+        objects, self.__objects = self.__objects, dict()
+        rect_list, self.__rects = self.__rects, list()
+        full_screen, self.__full_screen = self.__full_screen, False
+        drawn, self.__drawn = self.__drawn, dict()
+        if drawn:
+            last_drawn, self.__last_drawn = self.__last_drawn, drawn
+            rect_list.extend(last_drawn[obj] for obj in last_drawn.keys() - drawn.keys())
+            rect_list.extend(drawn[obj] for obj in drawn.keys() - last_drawn.keys())
+        if full_screen:
+            return [pygame.Rect(screen_rect)]
+        for obj, (rect, image, shown) in objects.items():
+            new_shown = obj.is_shown()
+            if shown == new_shown and image is obj.image and rect == obj.rect:
+                continue
+            if shown and image is not None:
+                rect_list.append(rect)
+            if new_shown:
+                rect_list.append(pygame.Rect(obj.rect))
+        rect_list = [rect.clip(screen_rect) for rect in merge_rects(rect_list)]
+        rect_list = [rect for rect in rect_list if rect.width > 0 and rect.height > 0]
+        if rect_list:
+            area = rect_list[0].unionall(rect_list[1:])
+            screen_area = screen_rect.width * screen_rect.height
+            if screen_area > 0 and (area.width * area.height) / screen_area > threshold:
+                return [pygame.Rect(screen_rect)]
+        return rect_list
+
+DIRTY_RECTS = DirtyRects()
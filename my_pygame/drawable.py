@@ -3,16 +3,40 @@
 from typing import Tuple, Optional, Any, Union, Callable
 import pygame
 from pygame.sprite import Sprite
-from .surface import create_surface
+from .surface import create_surface, get_surface_mask, invalidate_surface_mask
 from .vector import Vector2
+from .dirty_rect import DIRTY_RECTS
+from .transform_cache import TRANSFORM_CACHE
+from .quality import QUALITY
+
+def translate_position(kwargs: dict, x: int, y: int) -> dict:
+    translated = dict()
+    for key, value in kwargs.items():
+        if key in ("x", "left", "right", "centerx"):
+            value += x
+        elif key in ("y", "top", "bottom", "centery"):
+            value += y
+        elif key in ("center", "topleft", "topright", "bottomleft", "bottomright", "midtop", "midbottom", "midleft", "midright"):
+            value = (value[0] + x, value[1] + y)
+        translated[key] = value
+    return translated
+
+def get_offset(parent) -> Tuple[int, int]:
+    if parent is None:
+        return (0, 0)
+    x, y = parent.world_translation
+    return (round(x), round(y))
 
 class Drawable(Sprite):
 
     def __init__(self, surface: Optional[pygame.Surface] = None, rotate=0, **kwargs):
         Sprite.__init__(self)
-        self.__surface = self.__mask = None
+        self.__surface = None
         self.__rect = pygame.Rect(0, 0, 0, 0)
         self.__x = self.__y = 0
+        self.__parent = None
+        self.__world_rect = None
+        self.__world_offset = None
         self.__angle = 0
         self.__former_moves = dict()
         self.__draw_sprite = True
@@ -34,12 +58,14 @@ class Drawable(Sprite):
         self.move(**{name: value})
 
     def fill(self, color: pygame.Color) -> None:
-        self.image.fill(color)
+        self.own_image().fill(color)
         self.mask_update()
+        self.mark_dirty()
 
     def blit(self, source, dest, area=None, special_flags=0) -> pygame.Rect:
-        rect = self.image.blit(source, dest, area=area, special_flags=special_flags)
+        rect = self.own_image().blit(source, dest, area=area, special_flags=special_flags)
         self.mask_update()
+        self.mark_dirty()
         return rect
 
     def show(self) -> None:
@@ -49,6 +75,7 @@ class Drawable(Sprite):
         self.set_visibility(False)
 
     def set_visibility(self, status: bool) -> None:
+        self.__track_changes()
         self.__draw_sprite = bool(status)
 
     def is_shown(self) -> bool:
@@ -64,20 +91,62 @@ class Drawable(Sprite):
             surface = surface.image
         elif not isinstance(surface, pygame.Surface):
             surface = create_surface((0, 0))
+        self.__track_changes()
         self.__surface = surface
         self.__rect = self.__surface.get_rect(**self.__former_moves)
-        self.mask_update()
+
+    def own_image(self) -> pygame.Surface:
+        if TRANSFORM_CACHE.is_shared(self.__surface):
+            self.__surface = self.__surface.copy()
+        return self.__surface
 
     @property
     def rect(self) -> pygame.Rect:
+        if self.__parent is None:
+            return self.__rect
+        offset = get_offset(self.__parent)
+        if offset != self.__world_offset:
+            self.__world_offset = offset
+            self.__world_rect = self.__rect.move(offset)
+        return self.__world_rect
+
+    @property
+    def local_rect(self) -> pygame.Rect:
         return self.__rect
 
+    @property
+    def parent(self):
+        return self.__parent
+
+    def set_parent(self, parent) -> None:
+        if parent is self.__parent:
+            return
+        self.__track_changes()
+        former_x, former_y = get_offset(self.__parent)
+        self.__parent = parent
+        x, y = get_offset(parent)
+        self.__former_moves = translate_position(self.__former_moves or {"x": 0, "y": 0}, former_x - x, former_y - y)
+        self.__rect = self.__surface.get_rect(**self.__former_moves)
+        self.__x += former_x - x
+        self.__y += former_y - y
+        self.__world_offset = None
+
     @property
     def mask(self) -> pygame.mask.Mask:
-        return self.__mask
+        return get_surface_mask(self.__surface)
 
     def mask_update(self) -> None:
-        self.__mask = pygame.mask.from_surface(self.__surface)
+        invalidate_surface_mask(self.__surface)
+
+    def mark_dirty(self) -> None:
+        if self.is_shown():
+            DIRTY_RECTS.add(self.rect, self)
+
+    def __track_changes(self) -> None:
+        DIRTY_RECTS.track(self, self.rect, self.__surface, self.is_shown())
+        if self.__parent is not None:
+            self.__world_offset = None
+            self.__parent.invalidate_rect()
 
     @property
     def angle(self) -> float:
@@ -89,6 +158,7 @@ class Drawable(Sprite):
             surface.blit(self.image, self.rect)
             self.after_drawing(surface)
             self.focus_drawing(surface)
+            DIRTY_RECTS.drawn(self, self.rect)
 
     def before_drawing(self, surface: pygame.Surface) -> None:
         pass
@@ -102,6 +172,9 @@ class Drawable(Sprite):
     def move(self, **kwargs) -> None:
         if len(kwargs) == 0:
             return
+        if self.__parent is not None:
+            offset_x, offset_y = get_offset(self.__parent)
+            kwargs = translate_position(kwargs, -offset_x, -offset_y)
         x = self.__rect.x
         y = self.__rect.y
         common = ("center", "topleft", "topright", "bottomleft", "bottomright", "midtop", "midbottom", "midleft", "midright")
@@ -109,12 +182,14 @@ class Drawable(Sprite):
             kwargs["x"] = x
         if not any(key in kwargs for key in ("y", "top", "bottom", "centery", *common)):
             kwargs["y"] = y
+        self.__track_changes()
         self.__rect = self.image.get_rect(**kwargs)
         self.__x = self.__rect.x
         self.__y = self.__rect.y
         self.__former_moves = kwargs
 
     def move_ip(self, x: float, y: float) -> None:
+        self.__track_changes()
         self.__x += x
         self.__y += y
         self.__rect = self.__surface.get_rect(x=self.__x, y=self.__y)
@@ -124,6 +199,7 @@ class Drawable(Sprite):
         if milliseconds <= 0 or speed <= 0:
             self.move(**kwargs)
         else:
+            self.animate_move_stop()
             self.__animation_started = True
             self.__animation_params.update(
                 master=master,
@@ -132,7 +208,13 @@ class Drawable(Sprite):
                 kwargs=kwargs,
                 after_move=after_move
             )
-            self.__animate_move(**self.__animation_params)
+            self.__start_animate_move()
+
+    def __start_animate_move(self) -> None:
+        master = self.__animation_params["master"]
+        milliseconds = self.__animation_params["milliseconds"]
+        self.__animation_window_callback = master.after(milliseconds, lambda: self.__animate_move(**self.__animation_params), repeat=True)
+        self.__animate_move(**self.__animation_params)
 
     def __animate_move(self, master, milliseconds: float, speed: float, kwargs: dict, after_move: Callable[..., Any]) -> None:
         if not self.__animation_started:
@@ -145,12 +227,12 @@ class Drawable(Sprite):
             self.move(**kwargs)
             self.__animation_started = False
             self.__animation_params.clear()
+            master.remove_window_callback(self.__animation_window_callback)
             if callable(after_move):
                 after_move()
         else:
             direction.scale_to_length(speed)
             self.move_ip(direction.x, direction.y)
-            self.__animation_window_callback = master.after(milliseconds, lambda: self.__animate_move(**self.__animation_params))
 
     def animate_move_started(self) -> bool:
         return self.__animation_started
@@ -163,7 +245,7 @@ class Drawable(Sprite):
     def animate_move_restart(self):
         if not self.__animation_started and self.__animation_params:
             self.__animation_started = True
-            self.__animate_move(**self.__animation_params)
+            self.__start_animate_move()
 
     def rotate(self, angle: float) -> None:
         angle %= 360
@@ -179,13 +261,20 @@ class Drawable(Sprite):
              min_width: Optional[int] = None, min_height: Optional[int] = None,
              max_width: Optional[int] = None, max_height: Optional[int] = None,
              smooth=True) -> pygame.Surface:
-        if smooth:
-            scale_func = pygame.transform.smoothscale
-        else:
-            scale_func = pygame.transform.scale
         if not isinstance(surface, pygame.Surface):
             surface = create_surface((0, 0))
-        w, h = surface.get_size()
+        new_size = Drawable.get_resized_size(surface.get_size(), size=size, width=width, height=height,
+                                             min_width=min_width, min_height=min_height, max_width=max_width, max_height=max_height)
+        if new_size is None:
+            return surface
+        return TRANSFORM_CACHE.scale(surface, new_size, smooth and QUALITY.smooth_scale)
+
+    @staticmethod
+    def get_resized_size(actual_size: Tuple[int, int], size: Optional[Union[int, Tuple[int, int]]] = None,
+             width: Optional[int] = None, height: Optional[int] = None,
+             min_width: Optional[int] = None, min_height: Optional[int] = None,
+             max_width: Optional[int] = None, max_height: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        w, h = actual_size
         if isinstance(size, (list, tuple)):
             width, height = size
         elif isinstance(size, int):
@@ -205,17 +294,18 @@ class Drawable(Sprite):
         elif isinstance(max_height, int):
             height = min(max_height, height, h) if isinstance(height, int) else min(max_height, h)
         if isinstance(width, int) and isinstance(height, int):
-            surface = scale_func(surface, (width, height))
-        elif isinstance(width, int):
-            height = 0 if width == 0 else round(h * width / (w if w != 0 else width))
-            surface = scale_func(surface, (width, height))
-        elif isinstance(height, int):
-            width = 0 if height == 0 else round(w * height / (h if h != 0 else height))
-            surface = scale_func(surface, (width, height))
-        return surface
+            return (width, height)
+        if isinstance(width, int):
+            return (width, 0 if width == 0 else round(h * width / (w if w != 0 else width)))
+        if isinstance(height, int):
+            return (0 if height == 0 else round(w * height / (h if h != 0 else height)), height)
+        return None
 
     def set_size(self, *size: Union[int, Tuple[int, int]], smooth=True) -> None:
         size = size if len(size) == 2 else size[0]
+        if self.__valid_size and self.__is_actual_size(size):
+            return
+        self.__track_changes()
         try:
             self.image = self.resize_surface(self.image, size=size, smooth=smooth)
         except pygame.error:
@@ -223,7 +313,16 @@ class Drawable(Sprite):
         else:
             self.__valid_size = True
 
+    def __is_actual_size(self, size: Union[int, Tuple[int, int]]) -> bool:
+        if isinstance(size, (int, float)):
+            size = (size, size)
+        try:
+            return bool(tuple(round(value) for value in size) == self.__surface.get_size())
+        except TypeError:
+            return False
+
     def set_width(self, width: float, smooth=True)-> None:
+        self.__track_changes()
         try:
             self.image = self.resize_surface(self.image, width=width, smooth=smooth)
         except pygame.error:
@@ -232,6 +331,7 @@ class Drawable(Sprite):
             self.__valid_size = True
 
     def set_height(self, height: float, smooth=True) -> None:
+        self.__track_changes()
         try:
             self.image = self.resize_surface(self.image, height=height, smooth=smooth)
         except pygame.error:
@@ -43,14 +43,14 @@ class Entry(Clickable, RectangleShape):
             cursor_end = (self.__text.left + width, self.__text.centery + height // 2)
             pygame.draw.line(surface, self.__text.color, cursor_start, cursor_end, 2)
 
-    def __animate_cursor(self, milliseconds: float) -> None:
+    def __animate_cursor(self) -> None:
         if not self.edit():
             self.__show_cursor = False
             self.__cursor_animated = False
+            self.master.remove_window_callback(self.__cursor_animation_window_callback)
         else:
             self.__show_cursor = not self.__show_cursor
-            self.__cursor_animated = True
-            self.__cursor_animation_window_callback = self.master.after(milliseconds, lambda: self.__animate_cursor(milliseconds))
+            self.mark_dirty()
 
     @property
     def cursor(self) -> int:
@@ -70,11 +70,15 @@ class Entry(Clickable, RectangleShape):
     def start_edit(self) -> None:
         self.master.enable_text_input(self.rect)
         if not self.__cursor_animated:
-            self.__animate_cursor(500)
+            self.__cursor_animated = True
+            self.__cursor_animation_window_callback = self.master.after(500, self.__animate_cursor, repeat=True)
+            self.__animate_cursor()
 
     def stop_edit(self) -> None:
         self.master.disable_text_input()
         self.__show_cursor = False
+        self.__cursor_animated = False
+        self.mark_dirty()
         self.master.remove_window_callback(self.__cursor_animation_window_callback)
 
     def move(self, **kwargs) -> None:
@@ -102,6 +106,7 @@ class Entry(Clickable, RectangleShape):
                 elif event.key == pygame.K_END:
                     self.cursor = len(self.__text.message)
                 self.__show_cursor = True
+                self.mark_dirty()
             elif event.type == pygame.TEXTEDITING:
                 if event.length <= self.__nb_chars:
                     self.__text.message = event.text
@@ -0,0 +1,164 @@
+# -*- coding: Utf-8 -*
+
+import sys
+import time
+from typing import List, TextIO
+import pygame
+
+class LatenessHistogram:
+
+    __slots__ = ("__bucket_width", "__counts", "__overflow", "__nb_frames", "__total", "__max")
+
+    def __init__(self, bucket_width=0.25, nb_buckets=80):
+        self.__bucket_width = float(bucket_width)
+        self.__counts = [0] * int(nb_buckets)
+        self.__overflow = 0
+        self.__nb_frames = 0
+        self.__total = 0
+        self.__max = 0
+
+    def __len__(self) -> int:
+        return self.__nb_frames
+
+    @property
+    def bucket_width(self) -> float:
+        return self.__bucket_width
+
+    @property
+    def counts(self) -> List[int]:
+        return list(self.__counts)
+
+    @property
+    def overflow(self) -> int:
+        return self.__overflow
+
+    @property
+    def mean(self) -> float:
+        return self.__total / self.__nb_frames if self.__nb_frames else 0
+
+    @property
+    def max(self) -> float:
+        return self.__max
+
+    def record(self, lateness: float) -> None:
+        lateness = max(lateness, 0)
+        index = int(lateness / self.__bucket_width)
+        if index < len(self.__counts):
+            self.__counts[index] += 1
+        else:
+            self.__overflow += 1
+        self.__nb_frames += 1
+        self.__total += lateness
+        self.__max = max(self.__max, lateness)
+
+    def percentile(self, percent: float) -> float:
+        if self.__nb_frames == 0:
+            return 0
+        threshold = self.__nb_frames * percent / 100
+        count = 0
+        for index, bucket_count in enumerate(self.__counts):
+            count += bucket_count
+            if count >= threshold:
+                return (index + 1) * self.__bucket_width
+        return self.__max
+
+    def reset(self) -> None:
+        self.__counts = [0] * len(self.__counts)
+        self.__overflow = 0
+        self.__nb_frames = 0
+        self.__total = 0
+        self.__max = 0
+
+    def dump(self, file: TextIO = sys.stdout, title=str()) -> None:
+        if title:
+            print(title, file=file)
+        print(f"{self.__nb_frames} frames, mean {self.mean:.3f} ms, p99 {self.percentile(99):.2f} ms, max {self.__max:.3f} ms", file=file)
+        biggest = max(self.__counts + [self.__overflow, 1])
+        for index, count in enumerate(self.__counts):
+            if count > 0:
+                start = index * self.__bucket_width
+                bar = "#" * max(round(50 * count / biggest), 1)
+                print(f"{start:6.2f}-{start + self.__bucket_width:6.2f} ms |{bar} {count}", file=file)
+        if self.__overflow > 0:
+            print(f"{len(self.__counts) * self.__bucket_width:6.2f}+      ms |{'#' * max(round(50 * self.__overflow / biggest), 1)} {self.__overflow}", file=file)
+
+class FrameLimiter:
+
+    CLOCK = "clock"
+    HYBRID = "hybrid"
+    VSYNC = "vsync"
+
+    __slots__ = ("__mode", "__framerate", "__period", "__deadline", "__spin_margin", "__clock", "__histogram")
+
+    def __init__(self, framerate=60, mode=CLOCK, spin_margin=2):
+        self.__clock = pygame.time.Clock()
+        self.__histogram = LatenessHistogram()
+        self.__mode = FrameLimiter.CLOCK
+        self.__framerate = 0
+        self.__period = 0
+        self.__deadline = 0
+        self.__spin_margin = 0
+        self.mode = mode
+        self.framerate = framerate
+        self.spin_margin = spin_margin
+
+    @property
+    def mode(self) -> str:
+        return self.__mode
+
+    @mode.setter
+    def mode(self, mode: str) -> None:
+        if mode not in (FrameLimiter.CLOCK, FrameLimiter.HYBRID, FrameLimiter.VSYNC):
+            raise ValueError(f"Unknown frame pacing mode {repr(mode)}")
+        self.__mode = mode
+        self.restart()
+
+    @property
+    def framerate(self) -> int:
+        return self.__framerate
+
+    @framerate.setter
+    def framerate(self, framerate: int) -> None:
+        self.__framerate = max(int(framerate), 0)
+        self.__period = round(1e9 / self.__framerate) if self.__framerate > 0 else 0
+        self.restart()
+
+    @property
+    def spin_margin(self) -> float:
+        return self.__spin_margin / 1e6
+
+    @spin_margin.setter
+    def spin_margin(self, milliseconds: float) -> None:
+        self.__spin_margin = round(max(milliseconds, 0) * 1e6)
+
+    @property
+    def histogram(self) -> LatenessHistogram:
+        return self.__histogram
+
+    def restart(self) -> None:
+        self.__deadline = 0
+
+    def wait(self) -> None:
+        period = self.__period
+        if period == 0:
+            return
+        if self.__deadline == 0:
+            self.__deadline = time.perf_counter_ns() + period
+            return
+        deadline = self.__deadline
+        if self.__mode == FrameLimiter.CLOCK:
+            self.__clock.tick(self.__framerate)
+        elif self.__mode == FrameLimiter.HYBRID:
+            remaining = deadline - self.__spin_margin - time.perf_counter_ns()
+            if remaining > 0:
+                time.sleep(remaining / 1e9)
+            while time.perf_counter_ns() < deadline:
+                pass
+        now = time.perf_counter_ns()
+        self.__histogram.record((now - deadline) / 1e6)
+        if self.__mode == FrameLimiter.CLOCK:
+            deadline = now
+        deadline += period
+        if now - deadline > period:
+            deadline = now + period
+        self.__deadline = deadline
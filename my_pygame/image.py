@@ -2,6 +2,7 @@
 
 import pygame
 from .drawable import Drawable
+from .surface import convert_alpha
 
 class Image(Drawable):
 
@@ -10,7 +11,7 @@ class Image(Drawable):
 
     @classmethod
     def from_filepath(cls, filepath: str, **kwargs):
-        return cls(surface=pygame.image.load(filepath).convert_alpha(), **kwargs)
+        return cls(surface=convert_alpha(pygame.image.load(filepath)), **kwargs)
 
     def load(self, surface: pygame.Surface, **kwargs) -> None:
         self.image = self.resize_surface(surface, **kwargs)
\ No newline at end of file
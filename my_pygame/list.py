@@ -1,18 +1,34 @@
 # -*- coding: Utf-8 -*
 
-from typing import Sequence, Iterator, Any
+from typing import Sequence, Iterator, Any, List, Tuple
 import pygame
 from .drawable import Drawable
+from .collision import collide
 from .focusable import Focusable
 from .shape import RectangleShape
 from .colors import TRANSPARENT
+from .dirty_rect import DIRTY_RECTS
+
+def bounding_rect(rect_list: Sequence[pygame.Rect]) -> pygame.Rect:
+    left = min((rect.left for rect in rect_list), default=0)
+    right = max((rect.right for rect in rect_list), default=0)
+    top = min((rect.top for rect in rect_list), default=0)
+    bottom = max((rect.bottom for rect in rect_list), default=0)
+    return pygame.Rect(left, top, right - left, bottom - top)
 
 class DrawableList:
-    def __init__(self, bg_color=None, draw=True):
+
+    def __init__(self, bg_color=None, draw=True, transform=False):
         self.__bg_color = pygame.Color(bg_color) if bg_color is not None else TRANSPARENT
         self.__list = list()
         self.__index = -1
         self.__draw = draw
+        self.__transform = bool(transform)
+        self.__translation = (0, 0)
+        self.__parent = None
+        self.__bounds = None
+        self.__world_rect = None
+        self.__world_rect_translation = None
 
     def __len__(self) -> int:
         return len(self.__list)
@@ -28,13 +44,77 @@ class DrawableList:
 
     @property
     def rect(self) -> pygame.Rect:
-        left = min((obj.left for obj in self.__list), default=0)
-        right = max((obj.right for obj in self.__list), default=0)
-        top = min((obj.top for obj in self.__list), default=0)
-        bottom = max((obj.bottom for obj in self.__list), default=0)
-        width = right - left
-        height = bottom - top
-        return pygame.Rect(left, top, width, height)
+        if not self.__transform:
+            return bounding_rect([obj.rect for obj in self.__list])
+        translation = self.world_translation
+        if self.__world_rect is not None and translation == self.__world_rect_translation:
+            return self.__world_rect
+        if self.__bounds is None:
+            drawable_list = [obj.local_rect for obj in self.__list if isinstance(obj, Drawable)]
+            self.__bounds = (
+                bounding_rect(drawable_list) if drawable_list else None,
+                [obj for obj in self.__list if isinstance(obj, DrawableList)]
+            )
+        bounds, group_list = self.__bounds
+        rect_list = [obj.rect for obj in group_list]
+        if bounds is not None:
+            rect_list.append(bounds.move(round(translation[0]), round(translation[1])))
+        self.__world_rect = bounding_rect(rect_list)
+        self.__world_rect_translation = translation
+        return self.__world_rect
+
+    def invalidate_rect(self) -> None:
+        self.__bounds = None
+        self.__invalidate_world_rect()
+
+    def __invalidate_world_rect(self) -> None:
+        node = self
+        while node is not None and node.__world_rect is not None:
+            node.__world_rect = None
+            node = node.__parent
+
+    @property
+    def transform(self) -> bool:
+        return self.__transform
+
+    @property
+    def translation(self) -> Tuple[float, float]:
+        return self.__translation
+
+    @translation.setter
+    def translation(self, translation: Tuple[float, float]) -> None:
+        if not self.__transform:
+            raise TypeError("Only transform lists can be translated")
+        DIRTY_RECTS.add(self.rect, self)
+        self.__translation = tuple(translation)
+        parent = self.__parent
+        if parent is not None:
+            parent.__invalidate_world_rect()
+        DIRTY_RECTS.add(self.rect, self)
+        while parent is not None:
+            DIRTY_RECTS.touch(parent)
+            parent = parent.parent
+
+    @property
+    def world_translation(self) -> Tuple[float, float]:
+        if self.__parent is None:
+            return self.__translation
+        x, y = self.__translation
+        parent_x, parent_y = self.__parent.world_translation
+        return (x + parent_x, y + parent_y)
+
+    @property
+    def parent(self):
+        return self.__parent
+
+    def set_parent(self, parent) -> None:
+        if parent is self.__parent:
+            return
+        former_x, former_y = self.world_translation
+        self.__parent = parent
+        x, y = self.world_translation
+        self.__translation = (self.__translation[0] + former_x - x, self.__translation[1] + former_y - y)
+        self.__world_rect = None
 
     @property
     def end(self) -> int:
@@ -47,23 +127,41 @@ class DrawableList:
     def add(self, obj: Drawable, *objs: Drawable) -> None:
         for obj in [obj, *objs]:
             if isinstance(obj, (Drawable, DrawableList)) and obj not in self.__list:
+                if self.__transform:
+                    self.__adopt(obj)
                 self.__list.append(obj)
 
     def remove(self, *obj_list: Drawable) -> None:
         for obj in obj_list:
             if obj in self.__list:
                 self.__list.remove(obj)
+                self.__release(obj)
         self.__update_index()
 
     def remove_from_index(self, index: int) -> None:
         if index in range(len(self.__list)):
-            self.__list.pop(index)
+            self.__release(self.__list.pop(index))
             self.__update_index()
 
     def clear(self) -> None:
+        for obj in self.__list:
+            self.__release(obj)
         self.__list.clear()
         self.__index = -1
 
+    def __adopt(self, obj) -> None:
+        if isinstance(obj, DrawableList) and not obj.transform:
+            raise TypeError("Only transform lists can be added to a transform list")
+        if obj.parent is not None:
+            raise ValueError(f"{obj.__class__.__name__} object already belongs to another transform list")
+        obj.set_parent(self)
+        self.invalidate_rect()
+
+    def __release(self, obj) -> None:
+        if self.__transform and obj.parent is self:
+            obj.set_parent(None)
+            self.invalidate_rect()
+
     def empty(self) -> bool:
         if self.__list:
             return False
@@ -101,11 +199,33 @@ class DrawableList:
             obj.update(*args, **kwargs)
 
     def move(self, **kwargs) -> None:
-        pass
+        if self.__transform and kwargs and self.__list:
+            rect = self.rect
+            target = pygame.Rect(rect)
+            for name, value in kwargs.items():
+                setattr(target, name, value)
+            self.move_ip(target.x - rect.x, target.y - rect.y)
 
     def move_ip(self, x: float, y: float) -> None:
-        for obj in self.__list:
-            obj.move_ip(x, y)
+        if not self.__transform:
+            for obj in self.__list:
+                obj.move_ip(x, y)
+            return
+        self.translation = (self.__translation[0] + x, self.__translation[1] + y)
+
+    def collision_candidates(self, rect: pygame.Rect) -> Sequence[Drawable]:
+        drawable_list = self.drawable
+        return [drawable_list[i] for i in rect.collidelistall([obj.rect for obj in drawable_list])]
+
+    def collide(self, obj: Drawable) -> List[Tuple[Drawable, Tuple[int, int]]]:
+        collisions = list()
+        for other in self.collision_candidates(obj.rect):
+            if other is obj:
+                continue
+            point = collide(obj, other)
+            if point:
+                collisions.append((other, point))
+        return collisions
 
     def focus_get(self) -> Focusable:
         if self.__index < 0:
@@ -228,8 +348,8 @@ class AbstractDrawableListAligned(DrawableList):
     HORIZONTAL = "horizontal"
     VERTICAL = "vertical"
 
-    def __init__(self, offset: int, orient: str, bg_color=None, draw=True, justify="center"):
-        DrawableList.__init__(self, bg_color=bg_color, draw=draw)
+    def __init__(self, offset: int, orient: str, bg_color=None, draw=True, justify="center", transform=False):
+        DrawableList.__init__(self, bg_color=bg_color, draw=draw, transform=transform)
         self.__background = Drawable()
         self.offset = offset
         values = {
@@ -252,8 +372,9 @@ class AbstractDrawableListAligned(DrawableList):
         self.__justify = justify_dict[orient][justify]
 
     def add(self, obj: Drawable, *objs: Drawable) -> None:
+        start = len(self)
         DrawableList.add(self, obj, *objs)
-        self.__align_all_objects()
+        self.__align_all_objects(start)
 
     def remove(self, obj: Drawable, *objs: Drawable) -> None:
         DrawableList.remove(self, obj, *objs)
@@ -261,10 +382,13 @@ class AbstractDrawableListAligned(DrawableList):
 
     def remove_from_index(self, index: int) -> None:
         DrawableList.remove_from_index(self, index)
-        self.__align_all_objects()
+        if index > 0:
+            self.__align_all_objects(index)
 
     def move(self, **kwargs) -> None:
-        if self.list:
+        if self.transform:
+            DrawableList.move(self, **kwargs)
+        elif self.list:
             self.__background.set_size(self.size)
             self.__background.move(**kwargs)
             self.list[0].move(**{self.__start: self.__background[self.__start]})
@@ -272,21 +396,22 @@ class AbstractDrawableListAligned(DrawableList):
             self.__align_all_objects()
             DrawableList.move(self)
 
-    def __align_all_objects(self) -> None:
-        for obj_1, obj_2 in zip(self.list[:-1], self.list[1:]):
-            obj_2.move(**{self.__start: getattr(obj_1.rect, self.__end, 0) + self.offset})
-        for obj in self.list:
-            obj.move(**{self.__justify: getattr(self.list[0].rect, self.__justify, 0)})
+    def __align_all_objects(self, start=0) -> None:
+        obj_list = self.list
+        for i in range(max(start, 1), len(obj_list)):
+            obj_list[i].move(**{self.__start: getattr(obj_list[i - 1].rect, self.__end, 0) + self.offset})
+        for obj in obj_list[start:]:
+            obj.move(**{self.__justify: getattr(obj_list[0].rect, self.__justify, 0)})
 
 class DrawableListVertical(AbstractDrawableListAligned):
 
-    def __init__(self, offset: int, bg_color=None, draw=True, justify="center"):
-        AbstractDrawableListAligned.__init__(self, offset, AbstractDrawableListAligned.VERTICAL, bg_color=bg_color, draw=draw, justify=justify)
+    def __init__(self, offset: int, bg_color=None, draw=True, justify="center", transform=False):
+        AbstractDrawableListAligned.__init__(self, offset, AbstractDrawableListAligned.VERTICAL, bg_color=bg_color, draw=draw, justify=justify, transform=transform)
 
 class DrawableListHorizontal(AbstractDrawableListAligned):
 
-    def __init__(self, offset: int, bg_color=None, draw=True, justify="center"):
-        AbstractDrawableListAligned.__init__(self, offset, AbstractDrawableListAligned.HORIZONTAL, bg_color=bg_color, draw=draw, justify=justify)
+    def __init__(self, offset: int, bg_color=None, draw=True, justify="center", transform=False):
+        AbstractDrawableListAligned.__init__(self, offset, AbstractDrawableListAligned.HORIZONTAL, bg_color=bg_color, draw=draw, justify=justify, transform=transform)
 
 class ButtonListVertical(DrawableListVertical):
 
@@ -6,7 +6,7 @@ import struct
 import pickle
 from typing import List, Any, Optional
 from .thread import threaded_function
-from .clock import Clock
+from .clock import Clock, REAL_TIME
 
 STRUCT_FORMAT_PREFIX = ">I"
 STRUCT_FORMAT_SIZE = struct.calcsize(STRUCT_FORMAT_PREFIX)
@@ -192,7 +192,7 @@ class ClientSocket:
         return self.__msg.pop(msg, None)
 
     def wait_for(self, *messages: str, timeout=1) -> str:
-        clock = Clock()
+        clock = Clock(REAL_TIME)
         while self.connected() and not self.recv(ClientSocket.QUIT_MESSAGE, pop=True) and not clock.elapsed_time(timeout * 1000):
             for msg in messages:
                 if self.recv(msg):
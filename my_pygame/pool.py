@@ -0,0 +1,50 @@
+# -*- coding: Utf-8 -*
+
+from typing import Callable, Dict, Any
+
+class ObjectPool:
+
+    __slots__ = ("__factory", "__free", "__created", "__acquired", "__released", "__max_size")
+
+    def __init__(self, factory: Callable[..., Any], max_size=None):
+        self.__factory = factory
+        self.__free = list()
+        self.__created = 0
+        self.__acquired = 0
+        self.__released = 0
+        self.__max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self.__free)
+
+    def acquire(self, *args, **kwargs) -> Any:
+        self.__acquired += 1
+        if self.__free:
+            obj = self.__free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+        self.__created += 1
+        return self.__factory(*args, **kwargs)
+
+    def release(self, obj: Any) -> None:
+        self.__released += 1
+        if self.__max_size is None or len(self.__free) < self.__max_size:
+            self.__free.append(obj)
+
+    def reset_stats(self) -> None:
+        self.__created = self.__acquired = self.__released = 0
+
+    def clear(self) -> None:
+        self.__free.clear()
+        self.reset_stats()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "created": self.__created,
+            "acquired": self.__acquired,
+            "reused": self.__acquired - self.__created,
+            "released": self.__released,
+            "in_use": self.__acquired - self.__released,
+            "available": len(self.__free),
+        }
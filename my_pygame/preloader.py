@@ -0,0 +1,62 @@
+# -*- coding: Utf-8 -*
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Hashable, Any
+
+class Preloader:
+
+    __slots__ = ("__executor", "__tasks", "__lock", "__max_workers")
+
+    def __init__(self, max_workers=2):
+        self.__executor = None
+        self.__tasks = dict()
+        self.__lock = threading.Lock()
+        self.__max_workers = max_workers
+
+    def __len__(self) -> int:
+        return len(self.__tasks)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__tasks
+
+    def submit(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Future:
+        with self.__lock:
+            task = self.__tasks.get(key)
+            if task is None:
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="preloader")
+                task = self.__tasks[key] = self.__executor.submit(function, *args, **kwargs)
+            return task
+
+    def is_ready(self, key: Hashable) -> bool:
+        task = self.__tasks.get(key)
+        return task is not None and task.done()
+
+    def get(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Any:
+        with self.__lock:
+            task = self.__tasks.get(key)
+        if task is not None and not task.cancel():
+            try:
+                return task.result()
+            except Exception:
+                pass
+        result = function(*args, **kwargs)
+        with self.__lock:
+            task = self.__tasks[key] = Future()
+            task.set_result(result)
+        return result
+
+    def discard(self, key: Hashable) -> None:
+        with self.__lock:
+            task = self.__tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def clear(self) -> None:
+        with self.__lock:
+            tasks, self.__tasks = self.__tasks, dict()
+        for task in tasks.values():
+            task.cancel()
+
+PRELOADER = Preloader()
@@ -0,0 +1,207 @@
+# -*- coding: Utf-8 -*
+
+import time
+from array import array
+from typing import List, Dict
+import pygame
+from .drawable import Drawable
+from .surface import create_surface
+
+class RingBuffer(object):
+
+    __slots__ = ("__values", "__index", "__count")
+
+    def __init__(self, size: int):
+        self.__values = array("d", [0] * size)
+        self.__index = 0
+        self.__count = 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    @property
+    def size(self) -> int:
+        return len(self.__values)
+
+    def append(self, value: float) -> None:
+        self.__values[self.__index] = value
+        self.__index = (self.__index + 1) % len(self.__values)
+        self.__count = min(self.__count + 1, len(self.__values))
+
+    def clear(self) -> None:
+        self.__index = self.__count = 0
+
+    def last(self, nb_values: int) -> List[float]:
+        nb_values = min(nb_values, self.__count)
+        size = len(self.__values)
+        return [self.__values[(self.__index - nb_values + i) % size] for i in range(nb_values)]
+
+    def values(self) -> List[float]:
+        return self.last(self.__count)
+
+class FrameProfiler(object):
+
+    PHASES = ("callbacks", "update", "draw", "refresh", "events")
+
+    __slots__ = ("__enabled", "__nb_frames", "__frame_times", "__phase_times", "__frame_start", "__lap_start", "__current", "__hitches", "__hitch_threshold")
+
+    def __init__(self, size=1000):
+        self.__enabled = False
+        self.__nb_frames = 0
+        self.__frame_times = RingBuffer(size)
+        self.__phase_times = {phase: RingBuffer(size) for phase in FrameProfiler.PHASES}
+        self.__frame_start = self.__lap_start = 0
+        self.__current = dict.fromkeys(FrameProfiler.PHASES, 0)
+        self.__hitches = 0
+        self.__hitch_threshold = 1000 / 30
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    def enable(self) -> None:
+        if not self.__enabled:
+            self.reset()
+            self.__enabled = True
+
+    def disable(self) -> None:
+        self.__enabled = False
+
+    def reset(self) -> None:
+        self.__frame_times.clear()
+        for buffer in self.__phase_times.values():
+            buffer.clear()
+        self.__frame_start = 0
+        self.__hitches = 0
+
+    def set_target_frame_time(self, milliseconds: float, hitch_factor=2) -> None:
+        self.__hitch_threshold = milliseconds * hitch_factor
+
+    def start_frame(self) -> None:
+        if not self.__enabled:
+            return
+        now = time.perf_counter_ns()
+        if self.__frame_start > 0:
+            frame_time = (now - self.__frame_start) / 1e6
+            self.__frame_times.append(frame_time)
+            self.__nb_frames += 1
+            for phase, phase_time in self.__current.items():
+                self.__phase_times[phase].append(phase_time)
+            if frame_time > self.__hitch_threshold:
+                self.__hitches += 1
+        self.__current = dict.fromkeys(FrameProfiler.PHASES, 0)
+        self.__frame_start = self.__lap_start = now
+
+    def lap(self, phase: str) -> None:
+        if not self.__enabled:
+            return
+        now = time.perf_counter_ns()
+        self.__current[phase] += (now - self.__lap_start) / 1e6
+        self.__lap_start = now
+
+    @property
+    def nb_frames(self) -> int:
+        return self.__nb_frames
+
+    @property
+    def hitches(self) -> int:
+        return self.__hitches
+
+    @property
+    def frame_times(self) -> RingBuffer:
+        return self.__frame_times
+
+    @property
+    def phase_times(self) -> Dict[str, RingBuffer]:
+        return self.__phase_times
+
+    def average_fps(self) -> float:
+        frame_times = self.__frame_times.values()
+        if not frame_times:
+            return 0
+        return 1000 * len(frame_times) / sum(frame_times)
+
+    def low_fps(self, percent: float) -> float:
+        frame_times = sorted(self.__frame_times.values(), reverse=True)
+        if not frame_times:
+            return 0
+        worst = frame_times[:max(round(len(frame_times) * percent / 100), 1)]
+        return 1000 * len(worst) / sum(worst)
+
+class ProfilerOverlay(Drawable):
+
+    PHASE_COLORS = {
+        "callbacks": (200, 120, 255),
+        "update": (80, 160, 255),
+        "draw": (80, 220, 120),
+        "refresh": (255, 200, 60),
+        "events": (255, 100, 100),
+    }
+    IDLE_COLOR = (90, 90, 90)
+    BG_COLOR = (0, 0, 0, 180)
+    GRAPH_HEIGHT = 100
+    GRAPH_SCALE = 2 # pixels per ms
+    LINE_HEIGHT = 18
+
+    def __init__(self, profiler: FrameProfiler, width=360):
+        Drawable.__init__(self, create_surface((width, ProfilerOverlay.GRAPH_HEIGHT + 4 * ProfilerOverlay.LINE_HEIGHT + 4)))
+        self.__profiler = profiler
+        self.__graph = create_surface((width, ProfilerOverlay.GRAPH_HEIGHT))
+        self.__nb_frames_drawn = 0
+        self.__font = None
+        self.__stats = list()
+
+    def refresh_stats(self) -> None:
+        profiler = self.__profiler
+        if self.__font is None:
+            self.__font = pygame.font.Font(None, ProfilerOverlay.LINE_HEIGHT)
+        lines = [
+            f"{profiler.average_fps():.0f} FPS - 1% low: {profiler.low_fps(1):.0f} - 0.1% low: {profiler.low_fps(0.1):.0f}",
+            f"Hitches: {profiler.hitches}",
+            " ".join(f"{phase}: {self.__average(phase):.2f}" for phase in FrameProfiler.PHASES[:3]),
+            " ".join(f"{phase}: {self.__average(phase):.2f}" for phase in FrameProfiler.PHASES[3:]) + " (ms)",
+        ]
+        self.__stats = [self.__font.render(line, True, (255, 255, 255)) for line in lines]
+
+    def __average(self, phase: str) -> float:
+        values = self.__profiler.phase_times[phase].last(60)
+        return sum(values) / len(values) if values else 0
+
+    def before_drawing(self, surface: pygame.Surface) -> None:
+        self.__update_graph()
+        image = self.image
+        image.fill(ProfilerOverlay.BG_COLOR)
+        image.blit(self.__graph, (0, 0))
+        width = image.get_width()
+        for milliseconds in (1000 / 60, 1000 / 30):
+            y = ProfilerOverlay.GRAPH_HEIGHT - milliseconds * ProfilerOverlay.GRAPH_SCALE
+            pygame.draw.line(image, (255, 255, 255), (0, y), (width, y))
+        y = ProfilerOverlay.GRAPH_HEIGHT + 4
+        for line in self.__stats:
+            image.blit(line, (4, y))
+            y += ProfilerOverlay.LINE_HEIGHT
+
+    def __update_graph(self) -> None:
+        graph = self.__graph
+        width = graph.get_width()
+        nb_new_frames = min(self.__profiler.nb_frames - self.__nb_frames_drawn, width)
+        self.__nb_frames_drawn = self.__profiler.nb_frames
+        if nb_new_frames <= 0:
+            return
+        graph.scroll(dx=-nb_new_frames)
+        graph.fill((0, 0, 0, 0), (width - nb_new_frames, 0, nb_new_frames, ProfilerOverlay.GRAPH_HEIGHT))
+        bottom = ProfilerOverlay.GRAPH_HEIGHT
+        scale = ProfilerOverlay.GRAPH_SCALE
+        frame_times = self.__profiler.frame_times.last(nb_new_frames)
+        phase_times = [(ProfilerOverlay.PHASE_COLORS[phase], self.__profiler.phase_times[phase].last(nb_new_frames)) for phase in FrameProfiler.PHASES]
+        for i, frame_time in enumerate(frame_times):
+            x = width - len(frame_times) + i
+            y = bottom
+            for color, values in phase_times:
+                bar = values[i] * scale
+                if bar >= 1:
+                    pygame.draw.line(graph, color, (x, y), (x, y - bar))
+                y -= bar
+            top = bottom - frame_time * scale
+            if top < y:
+                pygame.draw.line(graph, ProfilerOverlay.IDLE_COLOR, (x, y), (x, max(top, 0)))
@@ -17,6 +17,7 @@ class ProgressBar(RectangleShape):
         RectangleShape.__init__(self, width, height, TRANSPARENT, outline=outline, **kwargs)
         if to <= from_:
             raise ValueError("end value 'to' must be greather than 'from'")
+        self.__percent = self.__value = None
         self.start = from_
         self.end = to
         self.percent = 0
@@ -124,8 +125,11 @@ class ProgressBar(RectangleShape):
             value = 1
         elif value < 0:
             value = 0
+        if value == self.__percent:
+            return
         self.__percent = value
         self.__value = self.__start + (self.__percent * self.__end)
+        self.mark_dirty()
 
     @property
     def value(self) -> float:
@@ -137,8 +141,11 @@ class ProgressBar(RectangleShape):
             value = self.__end
         elif value < self.__start:
             value = self.__start
+        if value == self.__value:
+            return
         self.__value = value
         self.__percent = (self.__value - self.__start) / (self.__end - self.__start)
+        self.mark_dirty()
 
     @property
     def start(self) -> float:
@@ -0,0 +1,156 @@
+# -*- coding: Utf-8 -*
+
+import time
+from collections import deque, namedtuple
+from typing import Callable, List, Any
+
+QualityDecision = namedtuple("QualityDecision", ["time", "previous", "level", "frame_time", "reason"])
+
+class QualityGovernor:
+
+    MINIMUM = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+    LEVEL_NAMES = ("minimum", "low", "medium", "high")
+
+    __slots__ = (
+        "__enabled", "__level", "__min_level", "__max_level", "__budget", "__average",
+        "__downgrade_ratio", "__upgrade_ratio", "__downgrade_frames", "__upgrade_frames",
+        "__over", "__under", "__log", "__callbacks"
+    )
+
+    def __init__(self, log_size=100):
+        self.__enabled = False
+        self.__level = QualityGovernor.HIGH
+        self.__min_level = QualityGovernor.MINIMUM
+        self.__max_level = QualityGovernor.HIGH
+        self.__budget = 1000 / 60
+        self.__average = 0
+        self.__downgrade_ratio = 1.0
+        self.__upgrade_ratio = 0.6
+        self.__downgrade_frames = 30
+        self.__upgrade_frames = 180
+        self.__over = self.__under = 0
+        self.__log = deque(maxlen=log_size)
+        self.__callbacks = list()
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    def enable(self) -> None:
+        self.__enabled = True
+        self.__over = self.__under = 0
+
+    def disable(self, restore=True) -> None:
+        self.__enabled = False
+        if restore:
+            self.__change_level(self.__max_level, "disabled")
+
+    @property
+    def level(self) -> int:
+        return self.__level
+
+    @level.setter
+    def level(self, level: int) -> None:
+        self.__change_level(level, "manual")
+
+    @property
+    def level_name(self) -> str:
+        return QualityGovernor.LEVEL_NAMES[self.__level]
+
+    def set_level_range(self, min_level=MINIMUM, max_level=HIGH) -> None:
+        self.__min_level = min(max(int(min_level), QualityGovernor.MINIMUM), QualityGovernor.HIGH)
+        self.__max_level = min(max(int(max_level), self.__min_level), QualityGovernor.HIGH)
+        self.__change_level(self.__level, "range")
+
+    @property
+    def budget(self) -> float:
+        return self.__budget
+
+    @budget.setter
+    def budget(self, milliseconds: float) -> None:
+        self.__budget = max(float(milliseconds), 0)
+
+    @property
+    def average_frame_time(self) -> float:
+        return self.__average
+
+    def set_hysteresis(self, downgrade_ratio=1.0, upgrade_ratio=0.6, downgrade_frames=30, upgrade_frames=180) -> None:
+        self.__downgrade_ratio = float(downgrade_ratio)
+        self.__upgrade_ratio = min(float(upgrade_ratio), self.__downgrade_ratio)
+        self.__downgrade_frames = max(int(downgrade_frames), 1)
+        self.__upgrade_frames = max(int(upgrade_frames), 1)
+        self.__over = self.__under = 0
+
+    @property
+    def hysteresis(self) -> dict:
+        return {
+            "downgrade_ratio": self.__downgrade_ratio,
+            "upgrade_ratio": self.__upgrade_ratio,
+            "downgrade_frames": self.__downgrade_frames,
+            "upgrade_frames": self.__upgrade_frames,
+        }
+
+    @property
+    def log(self) -> List[QualityDecision]:
+        return list(self.__log)
+
+    def clear_log(self) -> None:
+        self.__log.clear()
+
+    def bind(self, callback: Callable[[int], Any]) -> None:
+        if callback not in self.__callbacks:
+            self.__callbacks.append(callback)
+
+    def unbind(self, callback: Callable[[int], Any]) -> None:
+        if callback in self.__callbacks:
+            self.__callbacks.remove(callback)
+
+    def record_frame(self, milliseconds: float) -> None:
+        if not self.__enabled or self.__budget <= 0:
+            return
+        self.__average += (milliseconds - self.__average) * 0.1
+        if milliseconds > self.__budget * self.__downgrade_ratio:
+            self.__over += 1
+            self.__under = 0
+        else:
+            self.__over = max(self.__over - 1, 0)
+            if milliseconds < self.__budget * self.__upgrade_ratio:
+                self.__under += 1
+            else:
+                self.__under = 0
+        if self.__over >= self.__downgrade_frames and self.__level > self.__min_level:
+            self.__change_level(self.__level - 1, "over budget")
+        elif self.__under >= self.__upgrade_frames and self.__level < self.__max_level:
+            self.__change_level(self.__level + 1, "headroom")
+
+    def __change_level(self, level: int, reason: str) -> None:
+        level = min(max(int(level), self.__min_level), self.__max_level)
+        self.__over = self.__under = 0
+        if level == self.__level:
+            return
+        self.__log.append(QualityDecision(time.monotonic(), self.__level, level, self.__average, reason))
+        self.__level = level
+        for callback in list(self.__callbacks):
+            callback(level)
+
+    @property
+    def text_shadows(self) -> bool:
+        return self.__level >= QualityGovernor.HIGH
+
+    @property
+    def smooth_scale(self) -> bool:
+        return self.__level >= QualityGovernor.MEDIUM
+
+    @property
+    def animation_rate(self) -> float:
+        return 1 if self.__level >= QualityGovernor.MEDIUM else 0.5
+
+    @property
+    def scenery_density(self) -> float:
+        return 1 if self.__level >= QualityGovernor.LOW else 0.5
+
+QUALITY = QualityGovernor()
@@ -4,6 +4,7 @@ import os
 import pygame
 from typing import Tuple, Union, Dict, List, Any, Iterator
 from .thread import threaded_function
+from .surface import convert_alpha
 
 def find_in_iterable(iterable, *key_before, valid_callback=None) -> Iterator[Tuple[Union[int, str], ...]]:
     if isinstance(iterable, dict):
@@ -68,7 +69,7 @@ class Resources:
         if self.__loaded:
             return
         loading_method = [
-            (self.__img, self.img_to_load, lambda resource: pygame.image.load(resource).convert_alpha()),
+            (self.__img, self.img_to_load, lambda resource: convert_alpha(pygame.image.load(resource))),
             (self.__font, self.font_to_load, lambda resource: None),
             (self.__music, self.music_to_load, lambda resource: None),
             (self.__sfx, self.sfx_to_load, lambda resource: pygame.mixer.Sound(resource))
@@ -0,0 +1,48 @@
+# -*- coding: Utf-8 -*
+
+from typing import Type, Dict, Any
+from .window import Window
+
+class SceneCache:
+
+    __slots__ = ("__scenes", "__created", "__reused")
+
+    def __init__(self):
+        self.__scenes = dict()
+        self.__created = 0
+        self.__reused = 0
+
+    def __len__(self) -> int:
+        return len(self.__scenes)
+
+    def __contains__(self, cls: Type[Window]) -> bool:
+        return cls in self.__scenes
+
+    def get(self, cls: Type[Window], *args, **kwargs) -> Window:
+        scene = self.__scenes.get(cls)
+        if scene is None:
+            self.__created += 1
+            scene = self.__scenes[cls] = cls(*args, **kwargs)
+        elif scene.loop:
+            self.__created += 1
+            return cls(*args, **kwargs)
+        else:
+            self.__reused += 1
+            scene.reset(*args, **kwargs)
+        return scene
+
+    def discard(self, cls: Type[Window]) -> None:
+        self.__scenes.pop(cls, None)
+
+    def clear(self) -> None:
+        self.__scenes.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "created": self.__created,
+            "reused": self.__reused,
+            "cached": len(self.__scenes),
+        }
+
+SCENE_CACHE = SceneCache()
@@ -0,0 +1,89 @@
+# -*- coding: Utf-8 -*
+
+import heapq
+import itertools
+from typing import Callable, Any, Optional
+from .clock import GAME_TIME
+
+class WindowCallback(object):
+
+    __slots__ = ("callback", "wait_time", "deadline", "repeat", "pending", "cancelled")
+
+    def __init__(self, callback: Callable[..., Any], wait_time: float, deadline: float, repeat=False):
+        self.callback = callback
+        self.wait_time = wait_time
+        self.deadline = deadline
+        self.repeat = bool(repeat)
+        self.pending = False
+        self.cancelled = False
+
+    def __call__(self):
+        return self.callback()
+
+class Scheduler(object):
+
+    __slots__ = ("__heap", "__counter", "__nb_cancelled")
+
+    def __init__(self):
+        self.__heap = list()
+        self.__counter = itertools.count()
+        self.__nb_cancelled = 0
+
+    def __len__(self) -> int:
+        return len(self.__heap) - self.__nb_cancelled
+
+    def schedule(self, milliseconds: float, callback: Callable[..., Any], repeat=False) -> WindowCallback:
+        window_callback = WindowCallback(callback, milliseconds, GAME_TIME.now() + milliseconds, repeat=repeat)
+        self.__push(window_callback)
+        return window_callback
+
+    def __push(self, window_callback: WindowCallback) -> None:
+        window_callback.pending = True
+        heapq.heappush(self.__heap, (window_callback.deadline, next(self.__counter), window_callback))
+
+    def cancel(self, window_callback: Optional[WindowCallback]) -> None:
+        if not isinstance(window_callback, WindowCallback) or not window_callback.pending or window_callback.cancelled:
+            return
+        window_callback.cancelled = True
+        self.__nb_cancelled += 1
+        if self.__nb_cancelled > len(self.__heap) // 2:
+            for deadline, index, cancelled_callback in self.__heap:
+                if cancelled_callback.cancelled:
+                    cancelled_callback.pending = False
+            self.__heap = [entry for entry in self.__heap if not entry[2].cancelled]
+            heapq.heapify(self.__heap)
+            self.__nb_cancelled = 0
+
+    def clear(self) -> None:
+        for deadline, index, window_callback in self.__heap:
+            window_callback.pending = False
+        self.__heap.clear()
+        self.__nb_cancelled = 0
+
+    def next_deadline(self) -> Optional[float]:
+        heap = self.__heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)[2].pending = False
+            self.__nb_cancelled -= 1
+        return heap[0][0] if heap else None
+
+    def run_pending(self) -> int:
+        now = GAME_TIME.now()
+        due = list()
+        while self.__heap and self.__heap[0][0] <= now:
+            window_callback = heapq.heappop(self.__heap)[2]
+            if window_callback.cancelled:
+                self.__nb_cancelled -= 1
+                window_callback.pending = False
+                continue
+            due.append(window_callback)
+        for window_callback in due:
+            if window_callback.repeat:
+                window_callback.deadline = max(window_callback.deadline + window_callback.wait_time, now)
+                self.__push(window_callback)
+            else:
+                window_callback.pending = False
+        for window_callback in due:
+            if not window_callback.cancelled:
+                window_callback()
+        return len(due)
@@ -0,0 +1,32 @@
+# -*- coding: Utf-8 -*
+
+import math
+import pygame
+from .drawable import Drawable
+from .surface import create_surface
+
+class ScrollingImage(Drawable):
+
+    def __init__(self, tile: pygame.Surface, width: int, **kwargs):
+        self.__tile_width = max(tile.get_width(), 1)
+        self.__width = max(int(width), 0)
+        nb_tiles = math.ceil(self.__width / self.__tile_width) + 1
+        self.__strip = create_surface((nb_tiles * self.__tile_width, tile.get_height()))
+        for i in range(nb_tiles):
+            self.__strip.blit(tile, (i * self.__tile_width, 0))
+        self.__scroll = 0
+        Drawable.__init__(self, self.__view(0), **kwargs)
+
+    @property
+    def scroll(self) -> int:
+        return self.__scroll
+
+    @scroll.setter
+    def scroll(self, offset: float) -> None:
+        offset = round(offset) % self.__tile_width
+        if offset != self.__scroll:
+            self.__scroll = offset
+            self.image = self.__view(offset)
+
+    def __view(self, offset: int) -> pygame.Surface:
+        return self.__strip.subsurface((offset, 0, self.__width, self.__strip.get_height()))
@@ -1,15 +1,21 @@
 # -*- coding: Utf-8 -*
 
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Any
 import pygame
 from .drawable import Drawable
+from .surface import create_surface
 from .colors import TRANSPARENT, BLACK
 from .vector import Vector2
 
 class Shape(Drawable):
 
+    __raster_cache = True
+
     def __init__(self, color: pygame.Color, outline: int, outline_color: pygame.Color, **kwargs):
         Drawable.__init__(self, surface=None, size=None, width=None, height=None, min_width=None, min_height=None, max_width=None, max_height=None, smooth=False, **kwargs)
+        self.__color = self.__outline_color = None
+        self.__outline = 0
+        self.__raster_params = None
         self.color = color
         self.outline = outline
         self.outline_color = outline_color
@@ -20,7 +26,10 @@ class Shape(Drawable):
 
     @color.setter
     def color(self, value: pygame.Color) -> None:
-        self.__color = pygame.Color(value) if value is not None else TRANSPARENT
+        color = pygame.Color(value) if value is not None else TRANSPARENT
+        if color != self.__color:
+            self.__color = color
+            self.mark_dirty()
 
     @property
     def outline(self) -> int:
@@ -28,9 +37,10 @@ class Shape(Drawable):
 
     @outline.setter
     def outline(self, value: int) -> None:
-        self.__outline = int(value)
-        if self.__outline < 0:
-            self.__outline = 0
+        outline = max(int(value), 0)
+        if outline != self.__outline:
+            self.__outline = outline
+            self.mark_dirty()
 
     @property
     def outline_color(self) -> pygame.Color:
@@ -38,7 +48,41 @@ class Shape(Drawable):
 
     @outline_color.setter
     def outline_color(self, value: pygame.Color) -> None:
-        self.__outline_color = pygame.Color(value) if value is not None else TRANSPARENT
+        color = pygame.Color(value) if value is not None else TRANSPARENT
+        if color != self.__outline_color:
+            self.__outline_color = color
+            self.mark_dirty()
+
+    @staticmethod
+    def resize_surface(surface: pygame.Surface, smooth=True, **kwargs) -> pygame.Surface:
+        if not isinstance(surface, pygame.Surface):
+            surface = create_surface((0, 0))
+        size = Drawable.get_resized_size(surface.get_size(), **kwargs)
+        if size is None or size == surface.get_size():
+            return surface
+        return create_surface(size)
+
+    def before_drawing(self, surface: pygame.Surface) -> None:
+        raster_params = (self.image, pygame.Color(self.color), self.raster_params())
+        if not Shape.__raster_cache or raster_params != self.__raster_params:
+            self.own_image().fill(TRANSPARENT)
+            self.rasterize()
+            self.mask_update()
+            self.__raster_params = (self.image,) + raster_params[1:]
+
+    @staticmethod
+    def set_raster_cache(state: bool) -> None:
+        Shape.__raster_cache = bool(state)
+
+    @staticmethod
+    def raster_cache_enabled() -> bool:
+        return Shape.__raster_cache
+
+    def raster_params(self) -> Tuple[Any, ...]:
+        return tuple()
+
+    def rasterize(self) -> None:
+        pass
 
 class PolygonShape(Shape):
 
@@ -65,11 +109,12 @@ class PolygonShape(Shape):
         self.move(left=left, top=top)
         self.__from_property = False
 
-    def before_drawing(self, surface: pygame.Surface) -> None:
-        self.image.fill(TRANSPARENT)
-        if len(self.points) > 2:
+    def raster_params(self) -> Tuple[Any, ...]:
+        return tuple(tuple(point) for point in self.__image_points)
+
+    def rasterize(self) -> None:
+        if len(self.__image_points) > 2:
             pygame.draw.polygon(self.image, self.color, self.__image_points)
-        self.mask_update()
 
     def after_drawing(self, surface: pygame.Surface) -> None:
         if self.outline > 0 and len(self.points) > 2:
@@ -116,10 +161,11 @@ class RectangleShape(Shape):
             "border_bottom_right_radius": border_bottom_right_radius
         }
 
-    def before_drawing(self, surface: pygame.Surface) -> None:
-        self.image.fill(TRANSPARENT)
+    def raster_params(self) -> Tuple[Any, ...]:
+        return tuple(self.__draw_params.values())
+
+    def rasterize(self) -> None:
         pygame.draw.rect(self.image, self.color, self.image.get_rect(), **self.__draw_params)
-        self.mask_update()
 
     def after_drawing(self, surface: pygame.Surface) -> None:
         if self.outline > 0:
@@ -129,8 +175,9 @@ class RectangleShape(Shape):
         pygame.draw.rect(surface, highlight_color, self.rect, width=highlight_thickness, **self.__draw_params)
 
     def config(self, **kwargs) -> None:
-        for key, value in filter(lambda key, value: key in self.__draw_params, kwargs.items()):
+        for key, value in filter(lambda item: item[0] in self.__draw_params, kwargs.items()):
             self.__draw_params[key] = int(value)
+        self.mark_dirty()
 
     border_radius = property(
         lambda self: self.__draw_params["border_radius"],
@@ -178,10 +225,11 @@ class CircleShape(Shape):
             self.__radius = 0
         self.set_size(self.__radius * 2)
 
-    def before_drawing(self, surface: pygame.Surface) -> None:
-        self.image.fill(TRANSPARENT)
+    def raster_params(self) -> Tuple[Any, ...]:
+        return (self.radius, *self.__draw_params.values())
+
+    def rasterize(self) -> None:
         pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius, **self.__draw_params)
-        self.mask_update()
 
     def after_drawing(self, surface: pygame.Surface) -> None:
         if self.outline > 0:
@@ -191,8 +239,9 @@ class CircleShape(Shape):
         pygame.draw.circle(surface, highlight_color, self.center, self.radius, width=highlight_thickness, **self.__draw_params)
 
     def config(self, **kwargs) -> None:
-        for key, value in filter(lambda key, value: key in self.__draw_params, kwargs.items()):
+        for key, value in filter(lambda item: item[0] in self.__draw_params, kwargs.items()):
             self.__draw_params[key] = bool(value)
+        self.mark_dirty()
 
     draw_top_left = property(
         lambda self: self.__draw_params["draw_top_left"],
@@ -1,19 +1,62 @@
 # -*- coding: Utf-8 -*
 
 import itertools
-from typing import List, Union, Dict
+import weakref
+from typing import List, Tuple, Union, Dict, Sequence, Iterator
 import pygame
 from .surface import create_surface
 from .drawable import Drawable
-from .image import Image
+from .collision import CollisionData, get_collision_data
 from .clock import Clock
 
+class AnimationClip:
+
+    __slots__ = ("__sources", "__frames", "__collision_data", "__weakref__")
+
+    __cache = weakref.WeakValueDictionary()
+
+    def __init__(self, img_list: Sequence[pygame.Surface], **kwargs):
+        self.__sources = tuple(img_list)
+        self.__frames = tuple(Drawable.resize_surface(surface, **kwargs) for surface in self.__sources)
+        self.__collision_data = None
+
+    @staticmethod
+    def get(img_list: Sequence[pygame.Surface], **kwargs) -> "AnimationClip":
+        try:
+            key = (tuple(id(surface) for surface in img_list), tuple(sorted(kwargs.items())))
+            clip = AnimationClip.__cache.get(key)
+        except TypeError:
+            return AnimationClip(img_list, **kwargs)
+        if clip is None:
+            AnimationClip.__cache[key] = clip = AnimationClip(img_list, **kwargs)
+        return clip
+
+    @property
+    def collision_data(self) -> Tuple[CollisionData, ...]:
+        if self.__collision_data is None:
+            self.__collision_data = tuple(get_collision_data(surface) for surface in self.__frames)
+        return self.__collision_data
+
+    def resize(self, **kwargs) -> "AnimationClip":
+        return AnimationClip.get(self.__frames, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.__frames)
+
+    def __getitem__(self, index: int) -> pygame.Surface:
+        return self.__frames[index]
+
+    def __iter__(self) -> Iterator[pygame.Surface]:
+        return iter(self.__frames)
+
+EMPTY_CLIP = AnimationClip(tuple())
+
 class Sprite(Drawable):
 
     def __init__(self):
         Drawable.__init__(self)
         self.__sprites = dict()
-        self.__sprite_list = list()
+        self.__sprite_list = EMPTY_CLIP
         self.__nb_sprites = 0
         self.__sprite_idx = 0
         self.__clock = Clock()
@@ -21,23 +64,23 @@ class Sprite(Drawable):
         self.__animation = False
         self.__loop = False
 
-    def get_sprite_dict(self) -> Dict[str, List[Image]]:
+    def get_sprite_dict(self) -> Dict[str, AnimationClip]:
         return self.__sprites
 
-    def get_actual_sprite_list(self) -> List[Image]:
+    def get_actual_sprite_list(self) -> AnimationClip:
         return self.__sprite_list
 
-    def get_sprite_list(self, name: str) -> List[Image]:
-        return self.__sprites.get(str(name), list())
+    def get_sprite_list(self, name: str) -> AnimationClip:
+        return self.__sprites.get(str(name), EMPTY_CLIP)
 
-    def get_all_sprites(self) -> List[Image]:
+    def get_all_sprites(self) -> List[pygame.Surface]:
         return list(itertools.chain.from_iterable(self.__sprites.values()))
 
     def add_sprite(self, name: str, img: pygame.Surface, set_sprite=False, **kwargs) -> None:
         if not isinstance(img, pygame.Surface):
             return
         name = str(name)
-        self.__sprites[name] = [Image(img, **kwargs)]
+        self.__sprites[name] = AnimationClip.get([img], **kwargs)
         if set_sprite:
             self.set_sprite_list(name)
 
@@ -45,9 +88,7 @@ class Sprite(Drawable):
         if not img_list or any(not isinstance(obj, pygame.Surface) for obj in img_list):
             return
         name = str(name)
-        self.__sprites[name] = sprite_list = list()
-        for surface in img_list:
-            sprite_list.append(Image(surface, **kwargs))
+        self.__sprites[name] = AnimationClip.get(img_list, **kwargs)
         if set_sprite_list:
             self.set_sprite_list(name)
 
@@ -66,13 +107,22 @@ class Sprite(Drawable):
             self.image = create_surface((0, 0))
 
     def resize_sprite_list(self, name: str, **kwargs) -> None:
-        for sprite in self.get_sprite_list(name):
-            sprite.image = sprite.resize_surface(sprite.image, **kwargs)
+        name = str(name)
+        if name in self.__sprites:
+            self.__resize_clip(name, **kwargs)
 
     def resize_all_sprites(self, **kwargs) -> None:
-        for sprite in self.get_all_sprites():
-            sprite.image = sprite.resize_surface(sprite.image, **kwargs)
-        self.image = self.resize_surface(self.image, **kwargs)
+        for name in self.__sprites:
+            self.__resize_clip(name, **kwargs)
+        if self.__nb_sprites == 0:
+            self.image = self.resize_surface(self.image, **kwargs)
+
+    def __resize_clip(self, name: str, **kwargs) -> None:
+        clip = self.__sprites[name]
+        self.__sprites[name] = clip.resize(**kwargs)
+        if self.__sprite_list is clip:
+            self.__sprite_list = self.__sprites[name]
+            self.image = self.__sprite_list[self.__sprite_idx]
 
     def set_size(self, *size, smooth=True) -> None:
         pass
@@ -95,11 +145,12 @@ class Sprite(Drawable):
         return bool(self.__animation and self.__nb_sprites > 0)
 
     def before_drawing(self, surface: pygame.Surface) -> None:
-        if self.animated() and self.__clock.elapsed_time(self.__wait_time):
-            self.__sprite_idx = (self.__sprite_idx + 1) % self.__nb_sprites
-            self.image = self.__sprite_list[self.__sprite_idx]
-            if self.__sprite_idx == 0 and not self.__loop:
-                self.__animation = False
+        if self.animated():
+            if self.__clock.elapsed_time(self.__wait_time):
+                self.__sprite_idx = (self.__sprite_idx + 1) % self.__nb_sprites
+                self.image = self.__sprite_list[self.__sprite_idx]
+                if self.__sprite_idx == 0 and not self.__loop:
+                    self.__animation = False
 
     def start_animation(self, loop=False) -> None:
         self.__loop = bool(loop)
@@ -109,6 +160,7 @@ class Sprite(Drawable):
     def restart_animation(self) -> None:
         self.__animation = True
         self.__clock.tick()
+        self.mark_dirty()
 
     def stop_animation(self) -> None:
         self.__animation = False
\ No newline at end of file
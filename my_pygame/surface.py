@@ -1,7 +1,30 @@
 # -*- coding: Utf-8 -*
 
+import weakref
 from typing import Tuple
 import pygame
 
+MASK_CACHE = weakref.WeakKeyDictionary()
+COLLISION_DATA_CACHE = weakref.WeakKeyDictionary()
+
+def convert_alpha(surface: pygame.Surface) -> pygame.Surface:
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface
+    converted = pygame.Surface(surface.get_size(), flags=pygame.SRCALPHA, depth=32)
+    converted.blit(surface, (0, 0))
+    return converted
+
 def create_surface(size: Tuple[int, int]) -> pygame.Surface:
-    return pygame.Surface(size, flags=pygame.SRCALPHA|pygame.HWSURFACE).convert_alpha()
+    return convert_alpha(pygame.Surface(size, flags=pygame.SRCALPHA|pygame.HWSURFACE))
+
+def get_surface_mask(surface: pygame.Surface) -> pygame.mask.Mask:
+    mask = MASK_CACHE.get(surface)
+    if mask is None:
+        mask = MASK_CACHE[surface] = pygame.mask.from_surface(surface)
+    return mask
+
+def invalidate_surface_mask(surface: pygame.Surface) -> None:
+    MASK_CACHE.pop(surface, None)
+    COLLISION_DATA_CACHE.pop(surface, None)
@@ -7,6 +7,7 @@ from pygame.font import Font, SysFont
 from .surface import create_surface
 from .drawable import Drawable
 from .image import Image
+from .quality import QUALITY
 from .colors import BLACK
 
 class Text(Drawable):
@@ -28,6 +29,7 @@ class Text(Drawable):
         self.__shadow = (0, 0)
         self.__shadow_surface = Text(self.__str, self.font, BLACK, shadow=False) if shadow else None
         self.__shadow_color = BLACK
+        self.__render_key = None
         self.shadow_color = shadow_color
         self.config(message=message, font=font, color=color, img=img, justify=justify, compound=compound, shadow=(shadow_x, shadow_y))
         self.__update_surface()
@@ -144,7 +146,7 @@ class Text(Drawable):
             self.__shadow_surface.config(**config_for_shadow)
 
     def before_drawing(self, surface: pygame.Surface) -> None:
-        if self.__shadow_surface and self.__shadow_surface.is_shown():
+        if self.__shadow_surface and self.__shadow_surface.is_shown() and QUALITY.text_shadows:
             self.__shadow_surface.move(x=self.x + self.shadow[0], y=self.y + self.shadow[1])
             self.__shadow_surface.draw(surface)
 
@@ -157,6 +159,11 @@ class Text(Drawable):
         self.__update_surface()
 
     def __update_surface(self) -> None:
+        img_surface = self.img.image if isinstance(self.img, Image) else None
+        render_key = (self.message, self.font, tuple(self.color), self.justify, self.img, img_surface, self.compound, tuple(self.__custom_font.items()))
+        if render_key == self.__render_key:
+            return
+        self.__render_key = render_key
         render_lines = list()
         size = [0, 0]
         for index, line in enumerate(self.message.splitlines()):
@@ -212,7 +219,8 @@ class Text(Drawable):
             "bottom": {"bottom": rect_to_draw.bottom, "centerx": rect_to_draw.centerx},
             "center": {"center": rect_to_draw.center}
         }
-        self.img.move(**move_img[self.compound])
-        self.img.draw(surface_to_draw)
+        if self.img.is_shown():
+            img = self.img.image
+            surface_to_draw.blit(img, img.get_rect(**move_img[self.compound]))
         surface_to_draw.blit(text, text.get_rect(**move_text[self.compound]))
         self.image = surface_to_draw
\ No newline at end of file
@@ -0,0 +1,94 @@
+# -*- coding: Utf-8 -*
+
+import weakref
+import threading
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+
+class TransformCache:
+
+    __slots__ = ("__cache", "__sources", "__shared", "__lock", "__max_bytes", "__nb_bytes", "__hits", "__misses")
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.__cache = OrderedDict()
+        self.__sources = dict()
+        self.__shared = weakref.WeakSet()
+        self.__lock = threading.RLock()
+        self.__max_bytes = int(max_bytes)
+        self.__nb_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self.__lock:
+            self.__max_bytes = max(int(value), 0)
+            self.__evict()
+
+    @property
+    def nb_bytes(self) -> int:
+        return self.__nb_bytes
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def reset_stats(self) -> None:
+        self.__hits = self.__misses = 0
+
+    def is_shared(self, surface: pygame.Surface) -> bool:
+        return surface in self.__shared
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__cache.clear()
+            self.__sources.clear()
+            self.__nb_bytes = 0
+
+    def scale(self, surface: pygame.Surface, size: Tuple[int, int], smooth=True) -> pygame.Surface:
+        key = (id(surface), tuple(size), bool(smooth))
+        with self.__lock:
+            entry = self.__cache.get(key)
+            if entry is not None:
+                self.__cache.move_to_end(key)
+                self.__hits += 1
+                return entry[0]
+            self.__misses += 1
+        scale_func = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        result = scale_func(surface, size)
+        nb_bytes = result.get_pitch() * result.get_height()
+        with self.__lock:
+            if nb_bytes <= self.__max_bytes:
+                if id(surface) not in self.__sources:
+                    self.__sources[id(surface)] = weakref.ref(surface, lambda ref, source_id=id(surface): self.__forget(source_id))
+                self.__cache[key] = (result, nb_bytes)
+                self.__shared.add(result)
+                self.__nb_bytes += nb_bytes
+                self.__evict()
+        return result
+
+    def __evict(self) -> None:
+        while self.__nb_bytes > self.__max_bytes and self.__cache:
+            key, (surface, nb_bytes) = self.__cache.popitem(last=False)
+            self.__nb_bytes -= nb_bytes
+
+    def __forget(self, source_id: int) -> None:
+        with self.__lock:
+            self.__sources.pop(source_id, None)
+            for key in [key for key in self.__cache if key[0] == source_id]:
+                surface, nb_bytes = self.__cache.pop(key)
+                self.__nb_bytes -= nb_bytes
+
+TRANSFORM_CACHE = TransformCache()
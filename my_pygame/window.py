@@ -2,6 +2,8 @@
 
 import os
 import sys
+import math
+import time
 import configparser
 from typing import Callable, Any, Union, Optional, Type, Sequence, Tuple
 import pygame
@@ -13,36 +15,35 @@ from .progress import ProgressBar
 from .list import DrawableList
 from .joystick import Joystick, JoystickList
 from .keyboard import Keyboard
-from .clock import Clock
+from .clock import GAME_TIME
 from .colors import BLACK, WHITE, BLUE, TRANSPARENT
 from .resources import RESOURCES
+from .dirty_rect import DIRTY_RECTS
+from .surface import create_surface
+from .scheduler import Scheduler, WindowCallback
+from .profiler import FrameProfiler, ProfilerOverlay
+from .frame_limiter import FrameLimiter
+from .quality import QUALITY
 from .multiplayer import ServerSocket, ClientSocket
 
 CONFIG_FILE = os.path.join(sys.path[0], "window.conf")
 
-class WindowCallback(object):
-    def __init__(self, callback: Callable[..., Any], wait_time: float):
-        self.wait_time = wait_time
-        self.callback = callback
-        self.clock = Clock()
-
-    def can_call(self) -> bool:
-        return self.clock.elapsed_time(self.wait_time, restart=False)
-
-    def __call__(self):
-        return self.callback()
-
 class Window(object):
 
     MIXER_FREQUENCY = 44100
     MIXER_SIZE = -16
     MIXER_CHANNELS = 2
     MIXER_BUFFER = 512
+    HEADLESS_SIZE = (1280, 720)
+    IDLE_MAX_WAIT = 1000 #ms
 
     __main_window = None
     __default_key_repeat = (0, 0)
     __text_input_enabled = False
     __all_opened = list()
+    __scenes = list()
+    __scene_loop_running = False
+    __stepping = False
     __use_config = True
     __sound_volume = 50
     __music_volume = 50
@@ -52,6 +53,13 @@ class Window(object):
     __show_fps = False
     __fps = 60
     __fps_obj = None
+    __profiler = FrameProfiler()
+    __frame_limiter = FrameLimiter()
+    __profiler_overlay = None
+    __dirty_area_threshold = 0.5
+    __headless = False
+    __offscreen_surface = None
+    __last_drawn_window = None
     __joystick = JoystickList()
     __all_window_event_handler_dict = dict()
     __keyboard = Keyboard()
@@ -59,13 +67,15 @@ class Window(object):
     __server_socket = ServerSocket()
     __client_socket = ClientSocket()
 
-    def __init__(self, master=None, size=(0, 0), flags=0, bg_color=BLACK, bg_music=None, nb_joystick=0, loading=None, config=True):
+    def __init__(self, master=None, size=(0, 0), flags=0, bg_color=BLACK, bg_music=None, nb_joystick=0, loading=None, config=True, vsync=False):
         if not isinstance(Window.__main_window, Window):
             Window.__main_window = self
-        self.__init_pygame(size, flags, nb_joystick, loading, config)
+            self.__init_pygame(size, flags, nb_joystick, loading, config, vsync)
         self.__master = master
         self.__main_clock = pygame.time.Clock()
         self.__loop = False
+        self.__preloaded = False
+        self.__on_scene_close = None
         self.__show_fps_in_this_window = True
         self.__objects = DrawableList()
         self.__event_handler_dict = dict()
@@ -74,8 +84,21 @@ class Window(object):
         self.__joystick_handler_dict = dict()
         self.__joystick_state_dict = dict()
         self.__mouse_handler_list = list()
-        self.__callback_after = list()
-        self.rect_to_update = None
+        self.__callback_after = Scheduler()
+        self.__fps_callback = None
+        self.__fixed_timestep = 0
+        self.__last_frame_time = 0
+        self.__max_fixed_steps = 5
+        self.__accumulator = 0
+        self.__alpha = 0
+        self.__idle_mode = False
+        self.__last_frame_drawn = True
+        self.__last_frame_events = 0
+        self.__master_overlay = None
+        self.__master_snapshot = None
+        self.__master_drawn = dict()
+        self.__master_objects = tuple()
+        self.__master_revision = 0
         self.bg_color = bg_color
         self.bg_music = bg_music
         focus_event = (
@@ -91,11 +114,19 @@ class Window(object):
         self.__key_enabled = True
         self.__screenshot = False
         self.bind_key(pygame.K_F11, lambda event: self.screenshot())
+        self.bind_key(pygame.K_F3, lambda event: Window.show_profiler(not Window.profiler_is_shown()))
         if not Window.__fps_obj:
             Window.__fps_obj = Text(color=BLUE)
+        if not Window.__profiler_overlay:
+            Window.__profiler_overlay = ProfilerOverlay(Window.__profiler)
+            Window.__profiler_overlay.set_visibility(Window.__profiler.enabled)
+            Window.__profiler_overlay.move(left=0, bottom=self.rect.bottom)
 
-    def __init_pygame(self, size: Tuple[int, int], flags: int, nb_joystick: int, loading, config: bool) -> None:
+    def __init_pygame(self, size: Tuple[int, int], flags: int, nb_joystick: int, loading, config: bool, vsync: bool) -> None:
         if not pygame.get_init():
+            if Window.__headless:
+                os.environ["SDL_VIDEODRIVER"] = "dummy"
+                os.environ["SDL_AUDIODRIVER"] = "dummy"
             pygame.mixer.pre_init(Window.MIXER_FREQUENCY, Window.MIXER_SIZE, Window.MIXER_CHANNELS, Window.MIXER_BUFFER)
             status = pygame.init()
             if status[1] > 0:
@@ -108,12 +139,31 @@ class Window(object):
             Window.bind_event_all_window(pygame.CONTROLLERDEVICEADDED, Window.__joystick.event_connect)
             Window.bind_event_all_window(pygame.JOYDEVICEREMOVED, Window.__joystick.event_disconnect)
             Window.bind_event_all_window(pygame.CONTROLLERDEVICEREMOVED, Window.__joystick.event_disconnect)
-            if size[0] <= 0 or size[1] <= 0:
-                video_info = pygame.display.Info()
-                size = video_info.current_w, video_info.current_h
-            pygame.display.set_mode(tuple(size), flags)
+            Window.bind_event_all_window(pygame.VIDEOEXPOSE, lambda event: DIRTY_RECTS.invalidate())
+            QUALITY.bind(lambda level: DIRTY_RECTS.invalidate())
+            if Window.__headless:
+                if size[0] <= 0 or size[1] <= 0:
+                    size = Window.HEADLESS_SIZE
+                Window.__offscreen_surface = pygame.Surface(tuple(size))
+            else:
+                if size[0] <= 0 or size[1] <= 0:
+                    video_info = pygame.display.Info()
+                    size = video_info.current_w, video_info.current_h
+                Window.__set_display_mode(tuple(size), flags, vsync)
             self.__load_resources(loading)
 
+    @staticmethod
+    def __set_display_mode(size: Tuple[int, int], flags: int, vsync: bool) -> None:
+        if vsync:
+            try:
+                pygame.display.set_mode(size, flags, vsync=1)
+            except pygame.error:
+                pass
+            else:
+                Window.__frame_limiter.mode = FrameLimiter.VSYNC
+                return
+        pygame.display.set_mode(size, flags)
+
     def __load_resources(self, loading) -> None:
         nb_resources_to_load = len(RESOURCES)
         if nb_resources_to_load == 0:
@@ -191,29 +241,188 @@ class Window(object):
     @bg_color.setter
     def bg_color(self, color: pygame.Color) -> None:
         self.__bg_color = pygame.Color(color) if color is not None else TRANSPARENT
+        DIRTY_RECTS.invalidate()
 
     @property
     def loop(self) -> bool:
         return self.__loop
 
     def mainloop(self) -> None:
+        if self not in Window.__scenes:
+            Window.push_scene(self)
+
+    def run_frames(self, nb_frames: int) -> int:
+        stepping, Window.__stepping = Window.__stepping, True
+        nb_frames_done = 0
+        try:
+            Window.__pop_stopped_scenes()
+            if self not in Window.__scenes:
+                Window.push_scene(self)
+            while self in Window.__scenes and nb_frames_done < nb_frames:
+                scene = Window.__scenes[-1]
+                scene.__main_clock.tick()
+                scene.__loop_iteration()
+                Window.__pop_stopped_scenes()
+                nb_frames_done += 1
+        finally:
+            Window.__stepping = stepping
+        return nb_frames_done
+
+    @staticmethod
+    def push_scene(scene, on_close: Optional[Callable[..., Any]] = None) -> None:
+        if not scene.__preloaded:
+            scene.preload()
+            scene.__preloaded = True
+        scene.__on_scene_close = on_close
+        Window.__scenes.append(scene)
+        scene.__start_loop()
+        if not Window.__scene_loop_running and not Window.__stepping:
+            Window.__run_scenes()
+
+    @staticmethod
+    def pop_scene() -> None:
+        if Window.__scenes:
+            Window.__scenes[-1].stop()
+
+    @staticmethod
+    def replace_scene(scene, on_close: Optional[Callable[..., Any]] = None) -> None:
+        if not Window.__scenes:
+            Window.push_scene(scene, on_close=on_close)
+            return
+        former_scene = Window.__scenes.pop()
+        former_scene.__close_scene()
+        former_scene.teardown()
+        Window.push_scene(scene, on_close=on_close or former_scene.__on_scene_close)
+        former_scene.__on_scene_close = None
+
+    @staticmethod
+    def current_scene():
+        return Window.__scenes[-1] if Window.__scenes else None
+
+    @staticmethod
+    def __run_scenes() -> None:
+        Window.__scene_loop_running = True
+        try:
+            while Window.__scenes:
+                scene = Window.__scenes[-1]
+                scene.__wait_for_activity()
+                scene.__tick()
+                scene.__loop_iteration()
+                Window.__pop_stopped_scenes()
+        finally:
+            Window.__scene_loop_running = False
+
+    @staticmethod
+    def __pop_stopped_scenes() -> None:
+        scenes = Window.__scenes
+        popped = False
+        while scenes and not scenes[-1].loop:
+            scene = scenes.pop()
+            scene.teardown()
+            on_close, scene.__on_scene_close = scene.__on_scene_close, None
+            if callable(on_close):
+                on_close()
+            popped = True
+        if popped and scenes:
+            scenes[-1].__resume()
+
+    def preload(self) -> None:
+        pass
+
+    def reset(self, *args, **kwargs) -> None:
+        pass
+
+    def set_master(self, master) -> None:
+        self.__master = master
+        self.invalidate_master_snapshot()
+
+    def teardown(self) -> None:
+        pass
+
+    def __tick(self) -> None:
+        Window.__frame_limiter.wait()
+        self.__main_clock.tick()
+
+    def __start_loop(self) -> None:
         self.__loop = True
         Window.__all_opened.append(self)
         self.place_objects()
         self.set_grid()
+        self.invalidate_master_snapshot()
         self.fps_update()
         self.on_start_loop()
-        while self.__loop:
-            for callback in filter(lambda window_callback: window_callback.can_call(), self.__callback_after.copy()):
-                callback()
-                self.__callback_after.remove(callback)
-            self.__main_clock.tick(Window.__fps)
-            self.objects.focus_mode_update()
-            self.keyboard.update()
-            self.update()
-            self.draw_and_refresh()
-            self.event_handler()
-            self.handle_bg_music()
+        self.__resume()
+
+    def __resume(self) -> None:
+        self.__main_clock.tick()
+        self.__last_frame_time = GAME_TIME.now()
+        self.__accumulator = 0
+        self.__last_frame_drawn = True
+
+    def __loop_iteration(self) -> None:
+        frame_start = time.perf_counter()
+        profiler = Window.__profiler
+        profiler.start_frame()
+        self.__callback_after.run_pending()
+        profiler.lap("callbacks")
+        self.objects.focus_mode_update()
+        self.keyboard.update()
+        self.advance(self.__frame_time())
+        self.update()
+        profiler.lap("update")
+        if profiler.enabled:
+            Window.__profiler_overlay.mark_dirty()
+        self.draw_and_refresh()
+        self.event_handler()
+        self.handle_bg_music()
+        profiler.lap("events")
+        QUALITY.record_frame((time.perf_counter() - frame_start) * 1000)
+
+    def set_idle_mode(self, status: bool) -> None:
+        self.__idle_mode = bool(status)
+
+    @property
+    def idle_mode(self) -> bool:
+        return self.__idle_mode
+
+    def is_idle(self) -> bool:
+        return self.__idle_mode and not self.__last_frame_drawn and not self.__last_frame_events and not self.__input_held()
+
+    def __input_held(self) -> bool:
+        if any(self.keyboard.is_pressed(key_value) for key_value in self.__key_state_dict):
+            return True
+        for device_index, action_dict in self.__joystick_state_dict.items():
+            joystick = self.joystick[device_index]
+            if joystick is not None and any(joystick.get_value(action) for action in action_dict):
+                return True
+        return False
+
+    def __wait_for_activity(self) -> None:
+        if not self.is_idle():
+            return
+        timeout = Window.IDLE_MAX_WAIT
+        next_deadline = self.__callback_after.next_deadline()
+        if next_deadline is not None:
+            timeout = min(timeout, next_deadline - GAME_TIME.now())
+        if timeout <= 0:
+            return
+        event = pygame.event.wait(math.ceil(timeout))
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+        Window.__frame_limiter.restart()
+
+    def __frame_time(self) -> float:
+        now = GAME_TIME.now()
+        frame_time = now - self.__last_frame_time
+        self.__last_frame_time = now
+        return frame_time
+
+    def __close_scene(self) -> None:
+        self.__loop = False
+        self.on_quit()
+        self.set_focus(None)
+        if self in Window.__all_opened:
+            Window.__all_opened.remove(self)
 
     def stop(self, force=False, sound=None) -> None:
         self.__loop = False
@@ -239,6 +448,38 @@ class Window(object):
     def update(self) -> None:
         pass
 
+    def fixed_update(self) -> None:
+        pass
+
+    def set_fixed_timestep(self, milliseconds: float, max_steps=5) -> None:
+        self.__fixed_timestep = max(float(milliseconds), 0)
+        self.__max_fixed_steps = max(int(max_steps), 1)
+        self.__accumulator = 0
+        self.__alpha = 0
+
+    @property
+    def fixed_timestep(self) -> float:
+        return self.__fixed_timestep
+
+    @property
+    def alpha(self) -> float:
+        return self.__alpha
+
+    def advance(self, milliseconds: float) -> int:
+        if self.__fixed_timestep <= 0:
+            return 0
+        self.__accumulator += milliseconds
+        nb_steps = 0
+        while self.__accumulator >= self.__fixed_timestep:
+            if nb_steps >= self.__max_fixed_steps:
+                self.__accumulator %= self.__fixed_timestep
+                break
+            self.fixed_update()
+            self.__accumulator -= self.__fixed_timestep
+            nb_steps += 1
+        self.__alpha = self.__accumulator / self.__fixed_timestep
+        return nb_steps
+
     def place_objects(self) -> None:
         pass
 
@@ -246,22 +487,72 @@ class Window(object):
         pass
 
     def draw_screen(self, show_fps=True) -> None:
-        self.surface.fill(self.bg_color)
         if isinstance(self.__master, Window):
-            self.__master.draw_screen(show_fps=False)
+            self.__draw_master_snapshot()
+        else:
+            self.surface.fill(self.bg_color)
         self.objects.draw(self.surface)
         if Window.__show_fps is True and show_fps and self.__show_fps_in_this_window:
             Window.__fps_obj.draw(self.surface)
+        if show_fps:
+            Window.__profiler_overlay.draw(self.surface)
         if self.__screenshot:
             pygame.draw.rect(self.surface, WHITE, self.rect, width=30)
 
+    def set_master_overlay(self, color: Optional[pygame.Color]) -> None:
+        self.__master_overlay = pygame.Color(color) if color is not None else None
+        self.invalidate_master_snapshot()
+
+    def invalidate_master_snapshot(self) -> None:
+        self.__master_snapshot = None
+        self.__master_drawn = dict()
+        self.__master_objects = tuple()
+
+    def __draw_master_snapshot(self) -> None:
+        screen = self.surface
+        snapshot = self.__master_snapshot
+        if snapshot is None or snapshot.get_size() != screen.get_size() \
+        or DIRTY_RECTS.changed_since(self.__master_objects, self.__master_revision):
+            clip = screen.get_clip()
+            screen.set_clip(None)
+            self.__master.draw_screen(show_fps=False)
+            self.__master_drawn = DIRTY_RECTS.drawn_objects()
+            self.__master_objects = tuple(set(self.__master_drawn).union(self.__master.objects.drawable, self.__master.objects.list))
+            self.__master_revision = DIRTY_RECTS.revision
+            snapshot = self.__master_snapshot = screen.copy()
+            if self.__master_overlay is not None:
+                overlay = create_surface(snapshot.get_size())
+                overlay.fill(self.__master_overlay)
+                snapshot.blit(overlay, (0, 0))
+                screen.blit(snapshot, (0, 0))
+            screen.set_clip(clip)
+        else:
+            screen.blit(snapshot, (0, 0))
+            DIRTY_RECTS.redrawn(self.__master_drawn)
+
     @staticmethod
     def set_fps(framerate: int) -> None:
         Window.__fps = int(framerate)
+        Window.__frame_limiter.framerate = Window.__fps
+        if Window.__fps > 0:
+            Window.__profiler.set_target_frame_time(1000 / Window.__fps)
+            QUALITY.budget = 1000 / Window.__fps
+
+    @staticmethod
+    def set_frame_pacing(mode: str, spin_margin: Optional[float] = None) -> None:
+        Window.__frame_limiter.mode = mode
+        if spin_margin is not None:
+            Window.__frame_limiter.spin_margin = spin_margin
+
+    @staticmethod
+    def frame_limiter() -> FrameLimiter:
+        return Window.__frame_limiter
 
     @staticmethod
     def show_fps(status: bool) -> None:
         Window.__show_fps = bool(status)
+        if Window.__fps_obj:
+            Window.__fps_obj.mark_dirty()
 
     @staticmethod
     def config_fps_obj(**kwargs) -> None:
@@ -278,10 +569,35 @@ class Window(object):
     def fps_update(self) -> None:
         if Window.__show_fps:
             Window.__fps_obj.message = f"{round(self.__main_clock.get_fps())} FPS"
-        self.after(500, self.fps_update)
+        if Window.__profiler.enabled:
+            Window.__profiler_overlay.refresh_stats()
+        if self.__fps_callback is None:
+            self.__fps_callback = self.after(500, self.fps_update, repeat=True)
+
+    @staticmethod
+    def show_profiler(status: bool) -> None:
+        if status:
+            Window.__profiler.enable()
+        else:
+            Window.__profiler.disable()
+        if Window.__profiler_overlay:
+            Window.__profiler_overlay.set_visibility(status)
+
+    @staticmethod
+    def move_profiler(**kwargs) -> None:
+        Window.__profiler_overlay.move(**kwargs)
+
+    @staticmethod
+    def profiler_is_shown() -> bool:
+        return Window.__profiler.enabled
+
+    @staticmethod
+    def profiler() -> FrameProfiler:
+        return Window.__profiler
 
     def show_fps_in_this_window(self, status: bool) -> None:
         self.__show_fps_in_this_window = bool(status)
+        Window.__fps_obj.mark_dirty()
 
     def show_all(self, without=list()) -> None:
         for obj in self.objects:
@@ -293,12 +609,43 @@ class Window(object):
             if obj not in without:
                 obj.hide()
 
-    def refresh(self) -> None:
-        pygame.display.update(self.rect_to_update or self.rect)
+    @staticmethod
+    def set_headless(status: bool) -> None:
+        Window.__headless = bool(status)
+
+    @staticmethod
+    def is_headless() -> bool:
+        return Window.__headless
+
+    @staticmethod
+    def set_dirty_area_threshold(ratio: float) -> None:
+        Window.__dirty_area_threshold = min(max(float(ratio), 0), 1)
+
+    def get_dirty_area(self) -> Sequence[pygame.Rect]:
+        if Window.__last_drawn_window is not self:
+            Window.__last_drawn_window = self
+            DIRTY_RECTS.invalidate()
+        return DIRTY_RECTS.flush(self.rect, Window.__dirty_area_threshold)
+
+    def refresh(self, rect_list: Optional[Sequence[pygame.Rect]] = None) -> None:
+        if Window.__headless:
+            return
+        if rect_list is None:
+            pygame.display.update(self.rect)
+        elif rect_list:
+            pygame.display.update(rect_list)
 
     def draw_and_refresh(self, *args, **kwargs) -> None:
-        self.draw_screen(*args, **kwargs)
-        self.refresh()
+        rect_list = self.get_dirty_area()
+        self.__last_frame_drawn = bool(rect_list)
+        if rect_list:
+            screen = self.surface
+            screen.set_clip(rect_list[0].unionall(rect_list[1:]))
+            self.draw_screen(*args, **kwargs)
+            screen.set_clip(None)
+        Window.__profiler.lap("draw")
+        self.refresh(rect_list)
+        Window.__profiler.lap("refresh")
 
     def event_handler(self) -> None:
         for key_value, callback_list in self.__key_state_dict.items():
@@ -312,7 +659,9 @@ class Window(object):
             for action, callback_list in self.__joystick_state_dict[device_index].items():
                 for callback in callback_list:
                     callback(self.joystick[device_index].get_value(action))
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        self.__last_frame_events = len(events)
+        for event in events:
             if event.type == pygame.QUIT \
             or (event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and (event.mod & pygame.KMOD_LALT)):
                 self.stop(force=True)
@@ -372,14 +721,11 @@ class Window(object):
         else:
             Focusable.MODE = Focusable.MODE_MOUSE
 
-    def after(self, milliseconds: float, callback: Callable[..., Any]) -> WindowCallback:
-        window_callback = WindowCallback(callback, milliseconds)
-        self.__callback_after.append(window_callback)
-        return window_callback
+    def after(self, milliseconds: float, callback: Callable[..., Any], repeat=False) -> WindowCallback:
+        return self.__callback_after.schedule(milliseconds, callback, repeat=repeat)
 
     def remove_window_callback(self, window_callback: WindowCallback) -> None:
-        if window_callback in self.__callback_after:
-            self.__callback_after.remove(window_callback)
+        self.__callback_after.cancel(window_callback)
 
     def bind_event(self, event_type: int, callback: Callable[..., Any]) -> None:
         event_list = self.__event_handler_dict.get(event_type)
@@ -427,10 +773,12 @@ class Window(object):
             while os.path.isfile(os.path.join(sys.path[0], f"screenshot_{i}.png")):
                 i += 1
             pygame.image.save(self.surface, os.path.join(sys.path[0], f"screenshot_{i}.png"))
+            DIRTY_RECTS.invalidate()
             self.after(1000, self.__hide_screenshot_frame)
 
     def __hide_screenshot_frame(self) -> None:
         self.__screenshot = False
+        DIRTY_RECTS.invalidate()
 
     def handle_bg_music(self) -> None:
         if (not Window.__enable_music or self.bg_music is None) and pygame.mixer.get_busy():
@@ -584,7 +932,7 @@ class Window(object):
     def set_server_listen(listen: int) -> None:
         Window.__server_socket.listen = listen
 
-    surface = property(lambda self: pygame.display.get_surface())
+    surface = property(lambda self: Window.__offscreen_surface if Window.__headless else pygame.display.get_surface())
     rect = property(lambda self: self.surface.get_rect())
     left = property(lambda self: self.rect.left)
     right = property(lambda self: self.rect.right)
@@ -1,12 +1,13 @@
 # -*- coding: Utf-8 -*
 
+import math
 import random
-from typing import Dict, List, Union, Iterator
+from typing import Dict, List, Union
 import pygame
-from my_pygame import Window, Drawable, RectangleShape, Text, Image, Button
+from my_pygame import Window, Drawable, RectangleShape, Text, Image, Button, ScrollingImage
 from my_pygame import DrawableList, DrawableListHorizontal, DrawableListVertical
 from my_pygame import ButtonListHorizontal, ButtonListVertical
-from my_pygame import Sprite, CountDown, Clock
+from my_pygame import Sprite, AnimationClip, CountDown, Clock, ObjectPool, Camera, SCENE_CACHE, PRELOADER, QUALITY
 from my_pygame import GRAY, WHITE, BLACK, YELLOW, GREEN, GREEN_LIGHT, GREEN_DARK
 from constants import RESOURCES, ENVIRONMENT, CAR_INFOS, NB_TRAFFIC_CARS
 from save import SAVE
@@ -15,12 +16,32 @@ from .options import Options
 def format_number(number: float) -> str:
     return f"{number:,}".replace(",", " ")
 
+HANDLING_STEP = 10 #ms
+HANDLING_DRAG = 10 / 100 / 1000 # 10 percent of the speed lost per second
+
+def build_handling_table(car_infos: Dict[int, Dict[str, float]]) -> Dict[int, Dict[str, float]]:
+    table = dict()
+    for car_id, infos in car_infos.items():
+        table[car_id] = {
+            "max_speed": infos["max_speed"],
+            "acceleration": 100 / (infos["acceleration"] * 1000),
+            "braking": infos["max_speed"] / (infos["braking"] * 1000),
+            "steering": infos["maniability"] / 1000,
+        }
+    return table
+
+HANDLING_TABLE = build_handling_table(CAR_INFOS)
+
 class Car(Sprite):
     def __init__(self, img_list):
         Sprite.__init__(self)
         self.add_sprite_list("car", img_list, set_sprite_list=True, height=55)
         self.speed = 30
 
+    @property
+    def animation_factor(self) -> float:
+        return 1
+
     @property
     def speed(self):
         return self.__speed
@@ -28,13 +49,6 @@ class Car(Sprite):
     @speed.setter
     def speed(self, value: float):
         value = float(value)
-
-        min_value = 30
-        max_value = 150
-        ratio_min = 10
-        ratio_max = 50
-        ratio_coeff = (ratio_min - ratio_max) / (max_value - min_value)
-
         if value < 0:
             value = 0
         elif hasattr(self, "max_speed") and value > getattr(self, "max_speed"):
@@ -42,16 +56,26 @@ class Car(Sprite):
         self.__speed = value
 
         if self.__speed > 0:
-            self.ratio = ratio_coeff * self.__speed + (ratio_max - ratio_coeff * min_value)
-            if self.ratio < ratio_min:
-                self.ratio = ratio_min
-            elif self.ratio > ratio_max:
-                self.ratio = ratio_max
+            self.update_ratio()
             if not self.animated():
                 self.start_animation(loop=True)
         else:
             self.stop_animation()
 
+    def update_ratio(self):
+        min_value = 30
+        max_value = 150
+        ratio_min = 10
+        ratio_max = 50
+        ratio_coeff = (ratio_min - ratio_max) / (max_value - min_value)
+
+        self.ratio = ratio_coeff * self.__speed + (ratio_max - ratio_coeff * min_value)
+        if self.ratio < ratio_min:
+            self.ratio = ratio_min
+        elif self.ratio > ratio_max:
+            self.ratio = ratio_max
+        self.ratio *= self.animation_factor
+
 class PlayerCar(Car):
     def __init__(self, car_id: int):
         Car.__init__(self, RESOURCES.IMG["gameplay_cars"][car_id])
@@ -62,43 +86,35 @@ class PlayerCar(Car):
         self.__braking_offset = 0
         self.__move = False
         self.__move_offset = 0
-        self.__speed_clock = Clock()
-        self.__speed_time = 10 #ms
-        self.__move_clock = Clock()
-        self.__move_time = 10 #ms
         self.__crashed = False
         self.__speed_on_crash = 0
 
-        infos = CAR_INFOS[car_id]
-        self.max_speed = infos["max_speed"]
-        self.acceleration = infos["acceleration"] * 1000
-        self.maniability = infos["maniability"]
-        self.braking = infos["braking"] * 1000
+        self.__handling = HANDLING_TABLE[car_id]
+        self.max_speed = self.__handling["max_speed"]
 
-    def update(self, pixel_per_ms: int):
-        if not self.__crashed and self.__speed_clock.elapsed_time(self.__speed_time):
-            if self.__braking:
-                self.speed -= (self.__speed_time * self.max_speed / self.braking) * self.__braking_offset
-                if self.speed < 30:
-                    self.speed = 30
-            elif self.__speed_up:
-                self.speed += (self.__speed_time * 100 / self.acceleration) * self.__speed_up_offset
-            else:
-                ratio = 10 # percent
-                lost_speed = self.speed * ratio / 100
-                self.speed -= self.__speed_time * lost_speed / 1000
-                if self.speed < 30:
-                    self.speed = 30
-            self.__speed_up = False
-            self.__braking = False
-        if self.__move_clock.elapsed_time(self.__move_time):
-            if not self.__crashed:
-                if self.__move:
-                    self.move_ip(0, (self.__move_time * self.maniability / 1000) * self.__move_offset)
-                self.__move = False
-            else:
-                x = (-self.__speed_on_crash) * pixel_per_ms
-                self.move_ip(x, 0)
+    def update(self, pixel_per_ms: float, dt: float):
+        while dt > 0:
+            step = min(dt, HANDLING_STEP)
+            self.__integrate(pixel_per_ms, step)
+            dt -= step
+
+    def __integrate(self, pixel_per_ms: float, dt: float):
+        if self.__crashed:
+            self.move_ip(-self.__speed_on_crash * pixel_per_ms * dt / HANDLING_STEP, 0)
+            return
+        if self.__braking:
+            self.speed = max(self.speed - dt * self.__handling["braking"] * self.__braking_offset, 30)
+        elif self.__speed_up:
+            self.speed += dt * self.__handling["acceleration"] * self.__speed_up_offset
+        else:
+            self.speed = max(self.speed - dt * self.speed * HANDLING_DRAG, 30)
+        if self.__move:
+            self.move_ip(0, dt * self.__handling["steering"] * self.__move_offset)
+
+    def clear_controls(self):
+        self.__speed_up = False
+        self.__braking = False
+        self.__move = False
 
     def is_crashed(self):
         return self.__crashed
@@ -136,6 +152,15 @@ class TrafficCar(Car):
     def __init__(self, sprites_traffic_cars: dict, car_id: int, way: int):
         side = "opposé" if way in [0, 1] else "normal"
         Car.__init__(self, sprites_traffic_cars[side][car_id])
+        self.reset(sprites_traffic_cars, car_id, way)
+
+    @property
+    def animation_factor(self) -> float:
+        return 1 / QUALITY.animation_rate
+
+    def reset(self, sprites_traffic_cars: dict, car_id: int, way: int):
+        side = "opposé" if way in [0, 1] else "normal"
+        self.add_sprite_list("car", sprites_traffic_cars[side][car_id], set_sprite_list=True, height=55)
         self.way = way
         self.side = 1 if side == "normal" else -1
         self.speed = (35, 40, 50, 60)[car_id - 1]
@@ -146,7 +171,7 @@ class TrafficCar(Car):
 
 class TrafficCarList(DrawableList):
     def __init__(self, nb_ways: int, max_nb_car: int):
-        DrawableList.__init__(self)
+        DrawableList.__init__(self, transform=True)
         self.sprites_traffic_cars = dict()
         for side, car_list in RESOURCES.IMG["traffic"].items():
             self.sprites_traffic_cars[side] = dict()
@@ -154,6 +179,9 @@ class TrafficCarList(DrawableList):
                 self.sprites_traffic_cars[side][car_id] = img_list
         self.nb_ways = nb_ways
         self.max_nb_car = max_nb_car
+        self.pool = ObjectPool(TrafficCar)
+        self.__ways = [list() for _ in range(nb_ways)]
+        self.__neighbours = dict()
 
     def add_cars(self, master: Window, road: DrawableListVertical, score: int) -> None:
         ways = list(range(self.nb_ways))
@@ -166,22 +194,80 @@ class TrafficCarList(DrawableList):
         for _ in range(nb_cars_to_add):
             if len(self) >= self.max_nb_car:
                 break
-            car = TrafficCar(self.sprites_traffic_cars, random.randint(1, NB_TRAFFIC_CARS), random.choice(ways))
+            car = self.pool.acquire(self.sprites_traffic_cars, random.randint(1, NB_TRAFFIC_CARS), random.choice(ways))
             car.move(left=master.right, centery=(road[car.way].bottom + road[car.way + 1].top) / 2)
             car.start_animation(loop=True)
             self.add(car)
             ways.remove(car.way)
 
-    def way(self, index: int) -> Iterator[TrafficCar]:
-        return filter(lambda car: car.way == index, self.drawable)
+    def add(self, *car_list: TrafficCar) -> None:
+        for car in car_list:
+            if car in self:
+                continue
+            DrawableList.add(self, car)
+            way = self.__ways[car.way]
+            index = len(way)
+            while index > 0 and way[index - 1].left > car.left:
+                index -= 1
+            way.insert(index, car)
+            previous_car = way[index - 1] if index > 0 else None
+            next_car = way[index + 1] if index + 1 < len(way) else None
+            self.__neighbours[car] = [previous_car, next_car]
+            if previous_car is not None:
+                self.__neighbours[previous_car][1] = car
+            if next_car is not None:
+                self.__neighbours[next_car][0] = car
+
+    def remove(self, *car_list: TrafficCar) -> None:
+        for car in car_list:
+            if car in self:
+                DrawableList.remove(self, car)
+                self.__ways[car.way].remove(car)
+                previous_car, next_car = self.__neighbours.pop(car)
+                if previous_car is not None:
+                    self.__neighbours[previous_car][1] = next_car
+                if next_car is not None:
+                    self.__neighbours[next_car][0] = previous_car
+                self.pool.release(car)
+
+    def clear(self) -> None:
+        for car in self:
+            self.pool.release(car)
+        DrawableList.clear(self)
+        for way in self.__ways:
+            way.clear()
+        self.__neighbours.clear()
+
+    def remove_cars_out_of_screen(self) -> None:
+        for way in self.__ways:
+            while way and way[0].right < 0:
+                self.remove(way[0])
+
+    def collision_candidates(self, rect: pygame.Rect) -> List[TrafficCar]:
+        candidates = list()
+        for way in self.__ways:
+            if way and rect.top < way[0].bottom and way[0].top < rect.bottom:
+                candidates.extend(car for car in way if rect.colliderect(car.rect))
+        return candidates
+
+    def way(self, index: int) -> List[TrafficCar]:
+        return self.__ways[index]
 
     @property
     def ways(self) -> List[List[TrafficCar]]:
-        return [list(self.way(i + 1)) for i in range(self.nb_ways)]
+        return self.__ways
+
+    def leader(self, car: TrafficCar) -> Union[TrafficCar, None]:
+        previous_car, next_car = self.__neighbours[car]
+        return next_car if car.side > 0 else previous_car
+
+    def follower(self, car: TrafficCar) -> Union[TrafficCar, None]:
+        previous_car, next_car = self.__neighbours[car]
+        return previous_car if car.side > 0 else next_car
 
     @property
     def last(self) -> TrafficCar:
-        return max(self.drawable, key=lambda car: car.right, default=None)
+        return max((way[-1] for way in self.__ways if way), key=lambda car: car.right, default=None)
 
 class Info(Text):
     def __init__(self, title: str, extension="", round_n=1, **kwargs):
@@ -219,7 +305,7 @@ class Pause(Window):
         self.bind_joystick(0, "START", lambda event: self.stop())
         self.bind_joystick(0, "B", lambda event: self.stop())
         self.master = master
-        self.bg = RectangleShape(*self.size, (0, 0, 0, 170))
+        self.set_master_overlay((0, 0, 0, 170))
         params_for_all_buttons = {
             "font": (RESOURCES.FONT["algerian"], 100),
             "bg": GREEN,
@@ -238,13 +324,22 @@ class Pause(Window):
             Button(self, "Menu", **params_for_all_buttons, callback=self.return_to_menu)
         )
 
+    def reset(self, master):
+        self.set_master(master)
+        self.master = master
+        self.bg_music = master.bg_music
+        self.show_all()
+
+    def teardown(self):
+        self.master = None
+        self.set_master(None)
+
     def place_objects(self):
         self.menu_buttons.center = self.center
 
     def show_options(self):
-        self.hide_all(without=[self.bg])
-        Options(self).mainloop()
-        self.show_all()
+        self.hide_all()
+        self.push_scene(SCENE_CACHE.get(Options, self), on_close=self.show_all)
 
     def return_to_garage(self):
         self.master.go_to_garage = True
@@ -259,38 +354,26 @@ class EndGame(Window):
     def __init__(self, master, score: int, distance: float, time_100: float, time_opposite: float):
         Window.__init__(self, master=master, bg_music=master.bg_music)
         self.master = master
-        self.bg = RectangleShape(*self.size, (0, 0, 0, 170))
-        self.text_score = Text(f"Your score\n{score}", (RESOURCES.FONT["algerian"], 90), YELLOW, justify="center")
+        self.set_master_overlay((0, 0, 0, 170))
+        self.text_score = Text(font=(RESOURCES.FONT["algerian"], 90), color=YELLOW, justify="center")
         self.img_highscore = Image(RESOURCES.IMG["new_high_score"], width=150)
-        if score > SAVE["highscore"]:
-            SAVE["highscore"] = score
-        else:
-            self.img_highscore.hide()
-
-        MAX_MONEY = pow(10, 9) - 1
-        money_distance = round(300.40 * distance)
-        money_time_100 = round(12.5 * time_100)
-        money_time_opposite = round(21.7 * time_opposite)
-        money_gained = money_distance + money_time_100 + money_time_opposite
-        total = SAVE["money"] + money_gained
-        SAVE["money"] = MAX_MONEY if total > MAX_MONEY else total
-        self.text_money = Text(format_number(SAVE["money"]), (RESOURCES.FONT["algerian"], 50), YELLOW, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
+        self.text_money = Text(font=(RESOURCES.FONT["algerian"], 50), color=YELLOW, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
 
         font = ("calibri", 50)
         self.frame = RectangleShape(0.75 * self.width, 0.45 * self.height, BLACK, outline=1, outline_color=WHITE)
-        self.text_distance = Text(f"Distance: {distance}", font, WHITE)
+        self.text_distance = Text(font=font, color=WHITE)
         self.img_green_arrow_distance = Image(RESOURCES.IMG["green_arrow"], height=40)
-        self.text_money_distance = Text(money_distance, font, WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
-        self.text_time_100 = Text(f"Time up to 100: {time_100}", font, WHITE)
+        self.text_money_distance = Text(font=font, color=WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
+        self.text_time_100 = Text(font=font, color=WHITE)
         self.img_green_arrow_time_100 = Image(RESOURCES.IMG["green_arrow"], height=40)
-        self.text_money_time_100 = Text(money_time_100, font, WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
-        self.text_time_opposite = Text(f"Time in opposite side: {time_opposite}", font, WHITE)
+        self.text_money_time_100 = Text(font=font, color=WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
+        self.text_time_opposite = Text(font=font, color=WHITE)
         self.img_green_arrow_time_opposite = Image(RESOURCES.IMG["green_arrow"], height=40)
-        self.text_money_time_opposite = Text(money_time_opposite, font, WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
+        self.text_money_time_opposite = Text(font=font, color=WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
         self.total_money = DrawableListHorizontal(offset=10)
         self.total_money.add(
             Text("TOTAL: ", font, WHITE),
-            Text(money_gained, font, WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
+            Text(font=font, color=WHITE, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
         )
 
         params_for_all_buttons = {
@@ -309,6 +392,39 @@ class EndGame(Window):
             Button(self, "Garage", **params_for_all_buttons, callback=self.return_to_garage),
             Button(self, "Menu", **params_for_all_buttons, callback=self.return_to_menu)
         )
+        self.reset(master, score, distance, time_100, time_opposite)
+
+    def reset(self, master, score: int, distance: float, time_100: float, time_opposite: float):
+        self.set_master(master)
+        self.master = master
+        self.bg_music = master.bg_music
+        self.text_score.message = f"Your score\n{score}"
+        if score > SAVE["highscore"]:
+            SAVE["highscore"] = score
+            self.img_highscore.show()
+        else:
+            self.img_highscore.hide()
+
+        MAX_MONEY = pow(10, 9) - 1
+        money_distance = round(300.40 * distance)
+        money_time_100 = round(12.5 * time_100)
+        money_time_opposite = round(21.7 * time_opposite)
+        money_gained = money_distance + money_time_100 + money_time_opposite
+        total = SAVE["money"] + money_gained
+        SAVE["money"] = MAX_MONEY if total > MAX_MONEY else total
+        self.text_money.message = format_number(SAVE["money"])
+
+        self.text_distance.message = f"Distance: {distance}"
+        self.text_money_distance.message = money_distance
+        self.text_time_100.message = f"Time up to 100: {time_100}"
+        self.text_money_time_100.message = money_time_100
+        self.text_time_opposite.message = f"Time in opposite side: {time_opposite}"
+        self.text_money_time_opposite.message = money_time_opposite
+        self.total_money[1].message = money_gained
+
+    def teardown(self):
+        self.master = None
+        self.set_master(None)
 
     def place_objects(self):
         self.text_money.move(top=5, right=self.right - 10)
@@ -347,29 +463,32 @@ class EndGame(Window):
 class Gameplay(Window):
     def __init__(self, car_id: int, env: str):
         Window.__init__(self, bg_color=ENVIRONMENT[env], bg_music=RESOURCES.MUSIC["gameplay"])
+        Gameplay.load_assets(car_id, env)
         self.bind_key(pygame.K_ESCAPE, lambda event: self.pause())
         self.bind_joystick(0, "START", lambda event: self.pause())
 
         font = RESOURCES.FONT["cooperblack"]
 
         # Demaraction lines
-        self.road = DrawableListVertical(bg_color=GRAY, offset=70)
-        self.white_bands = list()
+        self.road = DrawableListVertical(offset=70, draw=False)
         white_bands_width = 50 #px
+        white_bands_offset = 20 #px
         white_lines_height = 10 #px
         for i in range(5):
-            if i % 2 == 0:
-                self.road.add(RectangleShape(self.width, white_lines_height, WHITE))
-            else:
-                white_bands = DrawableListHorizontal(offset=20)
-                while white_bands.width < self.width:
-                    white_bands.add(RectangleShape(white_bands_width, white_lines_height, WHITE))
-                self.road.add(white_bands)
-                self.white_bands.append(white_bands)
+            self.road.add(RectangleShape(self.width, white_lines_height, WHITE))
+        road_tile = pygame.Surface((white_bands_width + white_bands_offset, self.road.height))
+        road_tile.fill(GRAY)
+        for i, line in enumerate(self.road):
+            line_width = white_bands_width if i % 2 == 1 else road_tile.get_width()
+            road_tile.fill(WHITE, (0, line.top - self.road.top, line_width, white_lines_height))
+        self.road_texture = ScrollingImage(road_tile, self.width)
+        nb_white_bands = math.ceil((self.width + white_bands_offset) / road_tile.get_width())
+        self.white_bands_span = nb_white_bands * road_tile.get_width() - white_bands_offset
+        self.white_bands_origin = 0
 
         # Environment
-        self.env_top = DrawableListHorizontal(offset=400)
-        self.env_bottom = DrawableListHorizontal(offset=400)
+        self.env_top = DrawableListHorizontal(offset=400, transform=True)
+        self.env_bottom = DrawableListHorizontal(offset=400, transform=True)
         while self.env_top.width < self.width:
             self.env_top.add(Image(RESOURCES.IMG[env], height=110))
         while self.env_bottom.width < self.width:
@@ -395,23 +514,25 @@ class Gameplay(Window):
         self.car = PlayerCar(car_id)
         self.speed = 0
         self.traffic = TrafficCarList(nb_ways=4, max_nb_car=6)
-        self.clock_traffic = Clock()
+        self.traffic_time = 0
         self.img_crash = Image(RESOURCES.IMG["crash"], size=150)
         self.count_down = CountDown(self, 3, font=(font, 90), color=YELLOW, shadow=True, shadow_x=5, shadow_y=5)
         self.last_car_way = 0
 
-        # Background
-        self.background = DrawableList(draw=False)
-        self.background.add(
+        # World
+        self.world = DrawableList(draw=False, transform=True)
+        self.world.add(
             self.env_top,
             self.env_bottom,
-            *self.white_bands,
-            self.traffic
+            self.traffic,
+            self.img_crash
         )
+        self.camera = Camera(self.world)
+        self.distance_origin = 0
 
         # Default values
-        self.update_clock = Clock()
         self.update_time = 15 #ms
+        self.set_fixed_timestep(self.update_time)
         self.pixel_per_sec = 6 # For 1km/h
         self.pixel_per_ms = self.pixel_per_sec * self.update_time / 1000
         self.paused = False
@@ -421,14 +542,58 @@ class Gameplay(Window):
         self.disable_key_joy_focus()
         self.init_game()
 
+    @staticmethod
+    def load_car(car_id: int) -> AnimationClip:
+        return AnimationClip.get(RESOURCES.IMG["gameplay_cars"][car_id], height=55)
+
+    @staticmethod
+    def load_traffic() -> List[AnimationClip]:
+        return [AnimationClip.get(img_list, height=55) for car_list in RESOURCES.IMG["traffic"].values() for img_list in car_list.values()]
+
+    @staticmethod
+    def load_environment(env: str) -> pygame.Surface:
+        return Drawable.resize_surface(RESOURCES.IMG[env], height=110)
+
+    @staticmethod
+    def preload_assets(car_id: int, environments=ENVIRONMENT) -> None:
+        PRELOADER.submit(("gameplay_car", car_id), Gameplay.load_car, car_id)
+        PRELOADER.submit("gameplay_traffic", Gameplay.load_traffic)
+        for env in environments:
+            PRELOADER.submit(("gameplay_env", env), Gameplay.load_environment, env)
+
+    @staticmethod
+    def discard_assets(car_id: int) -> None:
+        PRELOADER.discard(("gameplay_car", car_id))
+
+    @staticmethod
+    def load_assets(car_id: int, env: str) -> None:
+        PRELOADER.get(("gameplay_car", car_id), Gameplay.load_car, car_id)
+        PRELOADER.get("gameplay_traffic", Gameplay.load_traffic)
+        PRELOADER.get(("gameplay_env", env), Gameplay.load_environment, env)
+
+    def on_start_loop(self):
+        QUALITY.bind(self.apply_quality)
+        self.apply_quality(QUALITY.level)
+
+    def teardown(self):
+        QUALITY.unbind(self.apply_quality)
+
+    def apply_quality(self, level: int):
+        for env in (self.env_top, self.env_bottom):
+            for i, img in enumerate(env):
+                img.set_visibility(QUALITY.scenery_density >= 1 or i % 2 == 0)
+        for car in self.traffic:
+            car.update_ratio()
+
     def pause(self):
         if not self.count_down.is_shown():
             self.paused = True
             self.car.stop_animation()
             for car in self.traffic:
                 car.stop_animation()
-        pause = Pause(self)
-        pause.mainloop()
+        self.push_scene(SCENE_CACHE.get(Pause, self), on_close=self.resume)
+
+    def resume(self):
         if self.loop and not self.count_down.is_shown():
             self.count_down.start(at_end=self.return_to_game)
             self.objects.set_priority(self.count_down, self.objects.end)
@@ -438,10 +603,8 @@ class Gameplay(Window):
         self.car.restart_animation()
         for car in self.traffic:
             car.restart_animation()
-        self.clock_traffic.tick()
         self.clock_time_100.tick()
         self.clock_time_opposite.tick()
-        self.update_clock.tick()
 
     def init_game(self):
         self.go_to_garage = False
@@ -454,9 +617,13 @@ class Gameplay(Window):
         self.total_time_100 = self.total_time_opposite = 0
         self.count_down.start()
         self.img_crash.hide()
+        self.distance_origin = self.camera.x
 
     def place_objects(self):
         self.count_down.center = self.road.center = self.center
+        self.road_texture.move(topleft=self.road.topleft)
+        self.white_bands_origin = self.road.centerx - self.white_bands_span // 2 + round(self.camera.x)
+        self.road_texture.scroll = self.camera.x - self.white_bands_origin
         self.infos_score.move(topleft=(10, 10))
         self.infos_speed.move(right=self.right - 10, top=10)
         self.infos_distance.move(right=self.right - 10, bottom=self.road.top - 10)
@@ -470,17 +637,17 @@ class Gameplay(Window):
         if self.paused:
             return
         self.update_player_car()
-        if self.update_clock.elapsed_time(self.update_time):
-            self.update_infos()
-            self.update_background()
-            self.update_traffic()
-            self.rect_to_update = (
-                self.road.rect, self.env_top.rect, self.env_bottom.rect,
-                self.infos_score.rect, self.infos_speed.rect, self.infos_distance.rect,
-                self.infos_time_100.rect, self.infos_time_opposite.rect
-            )
+
+    def fixed_update(self):
+        if self.paused:
+            return
+        self.car.update(self.pixel_per_ms, self.fixed_timestep)
+        self.update_infos()
+        self.update_background()
+        self.update_traffic()
 
     def update_player_car(self):
+        self.car.clear_controls()
         if not self.count_down.is_shown():
             joystick = self.joystick[0]
             controls = SAVE["controls"]
@@ -495,22 +662,19 @@ class Gameplay(Window):
                 car_function(joystick.get_value(control["joy"]))
             if SAVE["auto_acceleration"] is True:
                 self.car.speed_up()
-        self.car.update(self.pixel_per_ms)
         if self.car.top < self.road[0].bottom + 5:
             self.car.top = self.road[0].bottom + 5
         elif self.car.bottom > self.road[-1].top - 5:
             self.car.bottom = self.road[-1].top - 5
         if not self.car.is_crashed():
             self.speed = self.car.speed
-            for car in self.traffic:
-                collision = pygame.sprite.collide_mask(self.car, car)
-                if collision:
-                    self.car.crash(car)
-                    self.crashed_car = car
-                    self.play_sound(RESOURCES.SFX["crash"])
-                    self.img_crash.show()
-                    self.img_crash.move(centerx=collision[0] + self.car.left, centery=collision[1] + self.car.top)
-                    self.objects.set_priority(self.img_crash, self.objects.end)
+            for car, collision in self.traffic.collide(self.car):
+                self.car.crash(car)
+                self.crashed_car = car
+                self.play_sound(RESOURCES.SFX["crash"])
+                self.img_crash.show()
+                self.img_crash.move(centerx=collision[0] + self.car.left, centery=collision[1] + self.car.top)
+                self.objects.set_priority(self.img_crash, self.objects.end)
         elif self.car.right <= 0 and self.crashed_car.right <= 0:
             self.end_game()
 
@@ -549,40 +713,34 @@ class Gameplay(Window):
             self.infos_score.shadow_color = BLACK
         self.infos_score.value += score_to_add * self.update_time / 1000
         self.infos_speed.value = self.car.speed
-        self.infos_distance.value += self.car.speed * self.pixel_per_ms / (1000 * 3.6)
+        if not self.car.is_crashed():
+            self.infos_distance.value = (self.camera.x - self.distance_origin) / (1000 * 3.6)
 
     def update_background(self):
-        offset = self.speed * self.pixel_per_ms
-        self.background.move_ip(-offset, 0)
-        for white_bands_list in self.white_bands:
-            if white_bands_list[0].right <= 0:
-                white_bands_list.remove_from_index(0)
-            if white_bands_list[-1].right < self.right:
-                white_bands_list.add(RectangleShape(*white_bands_list[-1].size, WHITE))
+        speed = self.speed if self.car.is_crashed() else self.car.speed
+        self.camera.move_ip(speed * self.pixel_per_ms, 0)
+        self.road_texture.scroll = self.camera.x - self.white_bands_origin
         for env in (self.env_top, self.env_bottom):
             img = env[0]
             if img.right <= 0:
                 img.move(left=env[-1].right + env.offset)
                 env.set_priority(img, env.end)
-        if self.img_crash.is_shown():
-            self.img_crash.move_ip(-offset, 0)
 
     def update_traffic(self):
-        for car in self.traffic.drawable:
-            car.update(self.pixel_per_ms)
-            if car.right < 0:
-                self.traffic.remove(car)
-        for way, car_list in enumerate(self.traffic.ways, 1):
-            for i in range(1, len(car_list)):
-                car_1 = car_list[i - 1]
-                car_2 = car_list[i]
-                if car_2.left - car_1.right < 20:
-                    if (way in [1, 2]) and (car_1.speed < car_2.speed):
-                        car_2.speed = car_1.speed
-                    elif (way in [3, 4]) and (car_1.speed > car_2.speed):
-                        car_1.speed = car_2.speed
+        self.traffic.update(self.pixel_per_ms)
+        self.traffic.remove_cars_out_of_screen()
+        for car_list in self.traffic.ways:
+            for car in car_list:
+                leader = self.traffic.leader(car)
+                if leader is None or leader.speed >= car.speed:
+                    continue
+                gap = leader.left - car.right if car.side > 0 else car.left - leader.right
+                if gap < 20:
+                    car.speed = leader.speed
         ratio = (2 - (round(self.infos_score.value) / 20000)) * 1000
-        if self.car.speed > 30 and self.clock_traffic.elapsed_time(ratio):
+        self.traffic_time += self.update_time
+        if self.car.speed > 30 and self.traffic_time >= ratio:
+            self.traffic_time = 0
             if self.traffic.empty() or self.traffic.last.right < self.right - 20:
                 self.traffic.add_cars(self, self.road, round(self.infos_score.value))
 
@@ -594,8 +752,9 @@ class Gameplay(Window):
         distance = round(self.infos_distance.value, 1)
         time_100 = round(self.total_time_100, 1)
         time_opposite = round(self.total_time_opposite, 1)
-        window = EndGame(self, score, distance, time_100, time_opposite)
-        window.mainloop()
+        self.push_scene(SCENE_CACHE.get(EndGame, self, score, distance, time_100, time_opposite), on_close=self.after_end_game)
+
+    def after_end_game(self):
         if self.restart:
             self.traffic.clear()
             self.car.move(left=50, centery=self.road.centery)
@@ -121,7 +121,7 @@ class CarViewer(Clickable, Image):
 class ConfirmPayement(Window):
     def __init__(self, master):
         Window.__init__(self, master=master, bg_music=master.bg_music)
-        self.bg = RectangleShape(*self.size, (0, 0, 0, 170))
+        self.set_master_overlay((0, 0, 0, 170))
         self.frame = RectangleShape(0.50 * self.width, 0.50 * self.height, GREEN, outline=3)
         self.text = Text("Are you sure you want\nto buy this car ?", (RESOURCES.FONT["algerian"], 60), justify=Text.T_CENTER)
         self.button_yes = Button(
@@ -197,7 +197,9 @@ class EnvironmentChooser(Window):
 
     def play(self, env: str):
         gameplay = Gameplay(self.master.car_viewer.id, env)
-        gameplay.mainloop()
+        self.push_scene(gameplay, on_close=lambda: self.return_from_gameplay(gameplay))
+
+    def return_from_gameplay(self, gameplay: Gameplay):
         if not gameplay.go_to_garage:
             self.master.stop()
         else:
@@ -208,6 +210,7 @@ class Garage(Window):
 
     def __init__(self):
         Window.__init__(self, bg_color=GRAY, bg_music=RESOURCES.MUSIC["garage"])
+        self.set_idle_mode(True)
         params_for_all_buttons = {
             "bg": GREEN,
             "hover_bg": GREEN_LIGHT,
@@ -251,6 +254,7 @@ class Garage(Window):
         self.text_money = Text(format_number(SAVE["money"]), (RESOURCES.FONT["algerian"], 50), YELLOW, img=Image(RESOURCES.IMG["piece"], height=40), compound="right")
         self.text_highscore = Text("Highscore: {}".format(format_number(SAVE["highscore"])), (RESOURCES.FONT["algerian"], 50), YELLOW)
         self.padlock = Image(RESOURCES.IMG["padlock"])
+        self.preloaded_car = None
         self.bind_key(pygame.K_ESCAPE, lambda event: self.stop(sound=RESOURCES.SFX["back"]))
         self.bind_joystick(0, "B", lambda event: self.stop(sound=RESOURCES.SFX["back"]))
 
@@ -272,6 +276,7 @@ class Garage(Window):
             self.button_price.hide()
             self.button_play.state = Button.NORMAL
             SAVE["car"] = self.car_viewer.id
+            self.preload_gameplay(self.car_viewer.id)
         max_s = self.car_viewer.max_speed
         min_a = self.car_viewer.min_acceleration
         max_m = self.car_viewer.max_maniability
@@ -311,9 +316,24 @@ class Garage(Window):
         self.button_price.set_obj_on_side(on_top=self.car_viewer, on_bottom=self.button_play)
         self.button_play.set_obj_on_side(on_top=self.button_price)
 
+    def preload_gameplay(self, car_id: int):
+        if car_id == self.preloaded_car:
+            return
+        if self.preloaded_car is not None:
+            Gameplay.discard_assets(self.preloaded_car)
+        Gameplay.preload_assets(car_id)
+        self.preloaded_car = car_id
+
+    def teardown(self):
+        if self.preloaded_car is not None:
+            Gameplay.discard_assets(self.preloaded_car)
+            self.preloaded_car = None
+
     def buy_car(self):
         confirm_window = ConfirmPayement(self)
-        confirm_window.mainloop()
+        self.push_scene(confirm_window, on_close=lambda: self.return_from_payement(confirm_window))
+
+    def return_from_payement(self, confirm_window: ConfirmPayement):
         if confirm_window.buyed:
             SAVE["money"] -= self.car_viewer["price"]
             SAVE["owned_cars"][self.car_viewer.id] = True
@@ -322,7 +342,8 @@ class Garage(Window):
                 self.car_viewer.focus_set()
 
     def play(self):
-        environment_chooser = EnvironmentChooser(self)
-        environment_chooser.mainloop()
+        self.push_scene(EnvironmentChooser(self), on_close=self.update_texts)
+
+    def update_texts(self):
         self.text_money.message = format_number(SAVE["money"])
         self.text_highscore.message = "Highscore: {}".format(format_number(SAVE["highscore"]))
\ No newline at end of file
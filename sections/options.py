@@ -12,7 +12,7 @@ class AssignmentPrompt(Window):
 
         self.action = action
 
-        self.bg = RectangleShape(self.width, self.height, (0, 0, 0, 170))
+        self.set_master_overlay((0, 0, 0, 170))
         self.frame = RectangleShape(0.4 * self.width, 0.4 * self.height, BLACK, outline=3, outline_color=WHITE)
         self.escape = Text("Echap (clavier) ou bouton START (manette): Annuler", font=("calibri", 30), color=WHITE)
         self.instruction = Text("Appuyez sur une touche", font=("calibri", 50), color=WHITE)
@@ -45,6 +45,7 @@ class AssignmentPrompt(Window):
 class Options(Window):
     def __init__(self, master: Window):
         Window.__init__(self, master=master, bg_music=master.bg_music)
+        self.set_idle_mode(True)
         self.frame = RectangleShape(0.60 * self.width, 0.60 * self.height, GREEN, outline=3)
         self.title = Text("Options", font=(RESOURCES.FONT["algerian"], 70))
 
@@ -155,6 +156,19 @@ class Options(Window):
         self.bind_key(pygame.K_ESCAPE, lambda event: self.stop(sound=RESOURCES.SFX["back"]))
         self.bind_joystick(0, "B", lambda event: self.stop(sound=RESOURCES.SFX["back"]))
 
+    def reset(self, master: Window):
+        self.set_master(master)
+        self.bg_music = master.bg_music
+        self.page = 1
+        self.cb_music.value = self.get_music_state()
+        self.scale_music.value = Window.music_volume() * 100
+        self.cb_sound.value = self.get_sound_state()
+        self.scale_sound.value = Window.sound_volume() * 100
+        self.cb_show_fps.value = Window.fps_is_shown()
+
+    def teardown(self):
+        self.set_master(None)
+
     def on_quit(self):
         SAVE.dump()
 
@@ -245,4 +259,4 @@ class Options(Window):
         self.button_move_down.set_obj_on_side(on_top=self.button_move_up, on_left=self.button_back, on_bottom=self.button_change_page, on_right=self.button_change_page)
 
     def choose_key(self, action: str):
-        AssignmentPrompt(self, action).mainloop()
+        self.push_scene(AssignmentPrompt(self, action))
@@ -0,0 +1,87 @@
+# -*- coding: Utf-8 -*
+
+import os
+import sys
+import time
+import random
+sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+import pygame
+from my_pygame import Window, RESOURCES, GAME_TIME, get_collision_data
+from my_pygame.collision import collide_bbox, collide_hull, collide_mask
+from sections.gameplay import Gameplay
+
+FRAME_TIME = 1000 / 60
+NB_FRAMES = 1500
+NB_ROUNDS = 20
+
+def record_layouts() -> list:
+    gameplay = Gameplay(1, "suburb")
+    gameplay.place_objects()
+    gameplay.count_down.stop()
+    gameplay.count_down.hide()
+    gameplay.traffic.collide = lambda obj: list()
+    random.seed(0)
+    layouts = list()
+    steering = 0
+    for i in range(NB_FRAMES):
+        if i % 60 == 0:
+            steering = random.choice((-1, 0, 1))
+        gameplay.car.speed_up(1)
+        if steering < 0:
+            gameplay.car.moveUp(1)
+        elif steering > 0:
+            gameplay.car.moveDown(1)
+        GAME_TIME.advance(FRAME_TIME)
+        gameplay.advance(FRAME_TIME)
+        gameplay.keyboard.update()
+        gameplay.update()
+        player = (gameplay.car.image, pygame.Rect(gameplay.car.rect))
+        layouts.append((player, [(car.image, pygame.Rect(car.rect)) for car in gameplay.traffic]))
+    return layouts
+
+def strategy_rect(image_1, rect_1, image_2, rect_2) -> bool:
+    return rect_1.colliderect(rect_2)
+
+def strategy_mask(image_1, rect_1, image_2, rect_2) -> bool:
+    if not rect_1.colliderect(rect_2):
+        return False
+    return collide_mask(get_collision_data(image_1), rect_1, get_collision_data(image_2), rect_2) is not None
+
+def strategy_hull(image_1, rect_1, image_2, rect_2) -> bool:
+    if not rect_1.colliderect(rect_2):
+        return False
+    data_1, data_2 = get_collision_data(image_1), get_collision_data(image_2)
+    return collide_bbox(data_1, rect_1, data_2, rect_2) and collide_hull(data_1, rect_1, data_2, rect_2)
+
+def strategy_hull_mask(image_1, rect_1, image_2, rect_2) -> bool:
+    return strategy_hull(image_1, rect_1, image_2, rect_2) and strategy_mask(image_1, rect_1, image_2, rect_2)
+
+def main():
+    Window.set_headless(True)
+    Window(size=(1280, 720), nb_joystick=1, config=False)
+    RESOURCES.load()
+    GAME_TIME.use_virtual_clock()
+    layouts = record_layouts()
+    nb_pairs = sum(len(traffic) for player, traffic in layouts)
+    print(f"{len(layouts)} recorded layouts, {nb_pairs} player/car pairs")
+    strategies = (
+        ("rect", strategy_rect),
+        ("hull", strategy_hull),
+        ("mask", strategy_mask),
+        ("hull+mask", strategy_hull_mask),
+    )
+    for name, strategy in strategies:
+        nb_hits = 0
+        start = time.perf_counter()
+        for _ in range(NB_ROUNDS):
+            nb_hits = 0
+            for (player_image, player_rect), traffic in layouts:
+                for car_image, car_rect in traffic:
+                    nb_hits += strategy(player_image, player_rect, car_image, car_rect)
+        elapsed = (time.perf_counter() - start) / NB_ROUNDS
+        print(f"{name:<12}{elapsed * 1e6 / len(layouts):>10.2f} us/layout{nb_hits:>8} hits")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
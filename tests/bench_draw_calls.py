@@ -0,0 +1,76 @@
+# -*- coding: Utf-8 -*
+
+import os
+import sys
+import collections
+sys.path.insert(0, os.path.dirname(sys.path[0]))
+
+import pygame
+from my_pygame import Window, RESOURCES, GAME_TIME, DIRTY_RECTS
+from my_pygame.shape import Shape
+from sections.gameplay import Gameplay, Pause
+from sections.options import Options
+
+FRAME_TIME = 1000 / 60
+NB_FRAMES = 600
+
+counters = collections.Counter()
+
+def count_calls(module, name: str):
+    function = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        counters[f"{module.__name__}.{name}"] += 1
+        return function(*args, **kwargs)
+
+    setattr(module, name, wrapper)
+
+def report(title: str) -> float:
+    print(title)
+    for name, nb_calls in sorted(counters.items()):
+        print(f"{name:<24}{nb_calls / NB_FRAMES:>10.2f} calls/frame")
+    total = sum(counters.values()) / NB_FRAMES
+    print(f"{'total':<24}{total:>10.2f} calls/frame")
+    return total
+
+def run_scene(scene: Window, title: str) -> float:
+    scene.place_objects()
+    scene.set_grid()
+    counters.clear()
+    for i in range(NB_FRAMES):
+        if i % 10 == 0:
+            scene.objects.focus_next()
+        GAME_TIME.advance(FRAME_TIME)
+        scene.keyboard.update()
+        scene.update()
+        DIRTY_RECTS.invalidate()
+        scene.draw_and_refresh()
+    return report(title)
+
+def run(raster_cache: bool) -> float:
+    Shape.set_raster_cache(raster_cache)
+    cache_state = "on" if raster_cache else "off"
+    gameplay = Gameplay(1, "suburb")
+    total = run_scene(Pause(gameplay), f"Pause: {NB_FRAMES} frames, raster cache {cache_state}")
+    total += run_scene(Options(gameplay), f"Options: {NB_FRAMES} frames, raster cache {cache_state}")
+    return total
+
+def main():
+    Window.set_headless(True)
+    Window(size=(1280, 720), nb_joystick=1, config=False)
+    RESOURCES.load()
+    GAME_TIME.use_virtual_clock()
+    for name in ("rect", "circle", "polygon", "line"):
+        count_calls(pygame.draw, name)
+    count_calls(pygame.mask, "from_surface")
+
+    total_without_cache = run(raster_cache=False)
+    print()
+    total_with_cache = run(raster_cache=True)
+    print()
+    print(f"{'without raster cache':<24}{total_without_cache:>10.2f} calls/frame")
+    print(f"{'with raster cache':<24}{total_with_cache:>10.2f} calls/frame")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
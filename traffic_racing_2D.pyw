@@ -7,7 +7,7 @@ from sections.options import Options
 from my_pygame import Window, Image, Button, RectangleShape, Text, ImageButton
 from my_pygame import ButtonListVertical, DrawableListVertical
 from my_pygame import GREEN, GREEN_DARK, GREEN_LIGHT, YELLOW
-from my_pygame import RESOURCES
+from my_pygame import RESOURCES, SCENE_CACHE, QUALITY, FrameLimiter
 from my_pygame import Loading
 from save import SAVE
 
@@ -20,6 +20,7 @@ class CustomLoading(Loading):
 class Credits(Window):
     def __init__(self, master: Window):
         Window.__init__(self, master=master, bg_music=master.bg_music)
+        self.set_idle_mode(True)
         self.frame = RectangleShape(0.60 * self.width, 0.60 * self.height, GREEN, outline=3)
         title_font = ("calibri", 32, "bold")
         simple_font = ("calibri", 32)
@@ -49,6 +50,9 @@ class TrafficRacing(Window):
         self.set_title("Traffic Racing 2D")
         self.set_icon(RESOURCES.IMG["icon"])
         self.set_fps(120)
+        self.set_frame_pacing(FrameLimiter.HYBRID)
+        QUALITY.enable()
+        self.set_idle_mode(True)
         self.config_fps_obj(font=("calibri", 30))
         self.bind_key(pygame.K_ESCAPE, lambda key: self.stop())
         mouse_hide_event = (
@@ -104,16 +108,14 @@ class TrafficRacing(Window):
 
     def show_options(self):
         self.hide_all(without=[self.bg])
-        Options(self).mainloop()
-        self.show_all()
+        self.push_scene(SCENE_CACHE.get(Options, self), on_close=self.show_all)
 
     def show_credits(self):
         self.hide_all(without=[self.bg])
-        Credits(self).mainloop()
-        self.show_all()
+        self.push_scene(Credits(self), on_close=self.show_all)
 
     def goto_garage(self):
-        Garage().mainloop()
+        self.push_scene(Garage())
 
 def main():
     game = TrafficRacing()